@@ -1,5 +1,6 @@
 from audfactory.core.api import authentification
 from audfactory.core.api import checksum
+from audfactory.core.api import checksum_many
 from audfactory.core.api import deploy
 from audfactory.core.api import download
 from audfactory.core.api import group_id_to_path
@@ -8,6 +9,7 @@ from audfactory.core.api import path_to_group_id
 from audfactory.core.api import rest_api_get
 from audfactory.core.api import url
 from audfactory.core.api import versions
+from audfactory.core.config import config
 from audfactory.core.lookup import Lookup
 
 
@@ -1,17 +1,21 @@
+import contextlib
 import errno
+import functools
+import hashlib
 import os
+import sqlite3
 import typing
 
 from artifactory import ArtifactoryPath
 from artifactory import get_global_config_entry
-from artifactory import md5sum
-from artifactory import sha1sum
-from artifactory import sha256sum
 import dohq_artifactory
+import filelock
 import requests
 
 import audeer
 
+from audfactory.core.config import config
+
 
 def authentification(url) -> typing.Tuple[str, str]:
     """Look for username and API key.
@@ -63,6 +67,11 @@ def authentification(url) -> typing.Tuple[str, str]:
 def checksum(path, type='md5') -> str:
     r"""Calculate checksum for local or remote file.
 
+    If :attr:`audfactory.config.CHECKSUM_CACHE_ROOT` is set,
+    checksums of local files are cached
+    and only recalculated
+    if the file has changed.
+
     Args:
         path: local file path,
             or URL to file path on Artifactory
@@ -94,12 +103,51 @@ def checksum(path, type='md5') -> str:
         path = audeer.safe_path(path)
         if not os.path.exists(path):
             raise RuntimeError(f'File not found: {path}')
-        if type == 'md5':
-            return md5sum(path)
-        elif type == 'sha1':
-            return sha1sum(path)
-        elif type == 'sha256':
-            return sha256sum(path)
+        return _checksums(path, [type])[type]
+
+
+def checksum_many(
+        paths: typing.Sequence[str],
+        type: str = 'md5',
+        *,
+        num_workers: int = None,
+        verbose: bool = False,
+) -> typing.List[str]:
+    r"""Calculate checksums for several local or remote files.
+
+    Files are processed in parallel by :func:`audfactory.checksum`
+    using multiple threads.
+    As :mod:`hashlib` releases the GIL
+    while hashing large buffers,
+    local files are checksummed on several cores at once.
+
+    Args:
+        paths: local file paths,
+            or URLs to file paths on Artifactory
+        type: checksum type to calculate,
+            one of ``'md5'``, ``'sha1'``, ``'sha256'``
+        num_workers: number of parallel jobs.
+            If ``None`` will be set to the number of
+            processors on the machine multiplied by 5
+        verbose: show progress bar
+
+    Returns:
+        checksums in the same order as ``paths``
+
+    Raises:
+        RuntimeError: if a file cannot be found
+
+    """
+    if len(paths) == 0:
+        return []
+    params = [([path], {'type': type}) for path in paths]
+    return audeer.run_tasks(
+        checksum,
+        params,
+        num_workers=num_workers,
+        progress_bar=verbose,
+        task_description='Checksum',
+    )
 
 
 def deploy(
@@ -110,10 +158,36 @@ def deploy(
         sha1: str = None,
         sha256: str = None,
         parameters: typing.Dict = {},
+        by_checksum: bool = True,
+        retries: int = 0,
         verbose: bool = False,
 ) -> str:
     r"""Deploy local file as an artifact.
 
+    If ``by_checksum`` is ``True``,
+    it first tries to deploy the artifact by its checksum.
+    If the server already stores an artifact
+    with the same SHA1 checksum,
+    only the metadata is deployed
+    and the file is not uploaded.
+    Otherwise,
+    the file is uploaded as usual.
+
+    Checksums are calculated in a single pass over the file
+    before the upload starts.
+    The checksums are sent with the upload,
+    so the server rejects a corrupted upload.
+    If the upload fails due to a connection problem,
+    or it was rejected by the server,
+    the upload is repeated up to ``retries`` times
+    with the already calculated checksums.
+    Every repetition uploads the whole file again,
+    starting from its first byte.
+    An interrupted upload cannot be resumed,
+    and large files are not uploaded in parts,
+    so ``retries`` does not reduce the amount
+    of data sent for a large file.
+
     Args:
         path: local file path
         url: path on Artifactory
@@ -121,6 +195,10 @@ def deploy(
         sha1: SHA1 hash, will be calculated if not provided
         sha256: SHA256 hash, will be calculated if not provided
         parameters: attach any additional metadata
+        by_checksum: try to deploy by checksum
+            before uploading the file
+        retries: number of times an interrupted
+            or corrupted upload is repeated from the start of the file
         verbose: show information on the upload process
 
     Returns:
@@ -128,8 +206,15 @@ def deploy(
 
     Raises:
         FileNotFoundError: if local file does not exist
+        RuntimeError: if checksum of deployed artifact
+            does not match the given or calculated checksums
+        ValueError: if ``retries`` is negative
 
     """
+    if retries < 0:
+        raise ValueError(
+            f"'retries' has to be 0 or larger, not {retries}."
+        )
     src_path = audeer.safe_path(path)
     if not os.path.exists(src_path):
         raise FileNotFoundError(
@@ -145,24 +230,40 @@ def deploy(
         )
         print(desc, end='\r')
 
-    if md5 is None:
-        md5 = md5sum(src_path)
-    if sha1 is None:
-        sha1 = sha1sum(src_path)
-    if sha256 is None:
-        sha256 = sha256sum(src_path)
+    types = [
+        type for type, value in zip(
+            ['md5', 'sha1', 'sha256'],
+            [md5, sha1, sha256],
+        )
+        if value is None
+    ]
+    if types:
+        checksums = _checksums(src_path, types)
+        md5 = md5 or checksums.get('md5')
+        sha1 = sha1 or checksums.get('sha1')
+        sha256 = sha256 or checksums.get('sha256')
 
     dst_path = _path(url)
     if not dst_path.parent.exists():
         dst_path.parent.mkdir()
-    with open(src_path, "rb") as fobj:
-        dst_path.deploy(
-            fobj,
+
+    deployed = False
+    if by_checksum:
+        deployed = _deploy_by_checksum(
+            dst_path,
+            sha1=sha1,
+            sha256=sha256,
+            parameters=parameters,
+        )
+    if not deployed:
+        _deploy_file(
+            src_path,
+            dst_path,
             md5=md5,
             sha1=sha1,
             sha256=sha256,
             parameters=parameters,
-            quote_parameters=True,
+            retries=retries,
         )
 
     if verbose:  # pragma: no cover
@@ -178,10 +279,27 @@ def download(
         *,
         chunk: int = 4 * 1024,
         force_download: bool = True,
+        lock: bool = False,
         verbose=False,
 ) -> str:
     r"""Download an artifact.
 
+    The artifact is first stored under a temporary file name
+    and moved to ``destination`` when the download is complete,
+    so other processes never see a partly written file.
+
+    If ``lock`` is ``True``,
+    a lock file is created next to ``destination``
+    to ensure that only one process or thread
+    downloads the artifact at a time.
+    The lock file is removed
+    when the download has finished.
+    If another process or thread is downloading the artifact
+    to the same ``destination`` already,
+    it waits until the download has finished
+    and returns the downloaded file
+    without downloading it again.
+
     Args:
         url: artifact URL
         destination: path to store the artifact,
@@ -189,6 +307,8 @@ def download(
         chunk: amount of data read at once during the download
         force_download: forces the artifact to be downloaded
             even if it exists locally already
+        lock: lock ``destination``
+            while downloading the artifact
         verbose: show information on the download process
 
     Returns:
@@ -215,35 +335,14 @@ def download(
     if os.path.exists(destination) and not force_download:
         return destination
 
-    src_path = _path(url)
-    if not src_path.exists():
-        raise RuntimeError(f"Source '{url}' does not exists.")
-    src_size = ArtifactoryPath.stat(src_path).size
-
-    with audeer.progress_bar(total=src_size, disable=not verbose) as pbar:
-        desc = audeer.format_display_message(
-            'Download {}'.format(os.path.basename(str(src_path))),
-            pbar=True,
-        )
-        pbar.set_description_str(desc)
-        pbar.refresh()
-
-        try:
-            dst_size = 0
-            with src_path.open() as src_fp:
-                with open(destination, 'wb') as dst_fp:
-                    while src_size > dst_size:
-                        data = src_fp.read(chunk)
-                        n_data = len(data)
-                        if n_data > 0:
-                            dst_fp.write(data)
-                            dst_size += n_data
-                            pbar.update(n_data)
-        except (KeyboardInterrupt, Exception):
-            # Clean up broken artifact files
-            if os.path.exists(destination):
-                os.remove(destination)  # pragma: no cover
-            raise
+    if lock:
+        with _lock(destination) as waited:
+            if waited and os.path.exists(destination):
+                # Downloaded by another process or thread
+                return destination
+            _download(url, destination, chunk=chunk, verbose=verbose)
+    else:
+        _download(url, destination, chunk=chunk, verbose=verbose)
 
     return destination
 
@@ -304,7 +403,11 @@ def path(
 
     """
     username, apikey = authentification(url)
-    return ArtifactoryPath(url, auth=(username, apikey))
+    return ArtifactoryPath(
+        url,
+        auth=(username, apikey),
+        session=_session(username, apikey, *_tls_settings(url)),
+    )
 
 
 def path_to_group_id(
@@ -328,6 +431,9 @@ def path_to_group_id(
 
 def rest_api_get(
         url: str,
+        *,
+        headers: typing.Dict[str, str] = None,
+        stream: bool = False,
 ) -> requests.models.Response:
     """Execute a GET REST API request.
 
@@ -336,6 +442,14 @@ def rest_api_get(
 
     Args:
         url: REST API request URl
+        headers: additional HTTP headers,
+            e.g. ``{'If-None-Match': etag}``
+        stream: if ``True``
+            the content is not downloaded
+            before the response is returned,
+            but can be read in chunks,
+            e.g. with :meth:`requests.Response.iter_lines`.
+            The response should be closed afterwards
 
     Returns:
         server response
@@ -351,7 +465,11 @@ def rest_api_get(
 
     """
     username, apikey = authentification(url)
-    return requests.get(url, auth=(username, apikey))
+    return _session(username, apikey, *_tls_settings(url)).get(
+        url,
+        headers=headers,
+        stream=stream,
+    )
 
 
 def url(
@@ -451,6 +569,319 @@ def versions(
 _path = path
 
 
+def _calculate_checksums(
+        path: str,
+        types: typing.Sequence[str],
+        *,
+        chunk: int = 1024 * 1024,
+) -> typing.Dict[str, str]:
+    r"""Calculate several checksums of a local file in a single pass."""
+    hashes = {type: hashlib.new(type) for type in types}
+    with open(path, 'rb') as fp:
+        for data in iter(lambda: fp.read(chunk), b''):
+            for h in hashes.values():
+                h.update(data)
+    return {type: h.hexdigest() for type, h in hashes.items()}
+
+
+@contextlib.contextmanager
+def _checksum_cache() -> typing.Iterator[sqlite3.Connection]:
+    r"""Connect to persistent checksum cache.
+
+    Changes are committed on exit.
+
+    """
+    root = audeer.mkdir(audeer.safe_path(config.CHECKSUM_CACHE_ROOT))
+    db = sqlite3.connect(os.path.join(root, 'checksums.db'), timeout=60)
+    try:
+        with db:
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS checksums ('
+                'path TEXT, '
+                'type TEXT, '
+                'inode INTEGER, '
+                'size INTEGER, '
+                'mtime_ns INTEGER, '
+                'checksum TEXT, '
+                'PRIMARY KEY (path, type))'
+            )
+            yield db
+    finally:
+        db.close()
+
+
+def _checksums(
+        path: str,
+        types: typing.Sequence[str],
+) -> typing.Dict[str, str]:
+    r"""Calculate several checksums of a local file.
+
+    If :attr:`audfactory.config.CHECKSUM_CACHE_ROOT` is set,
+    checksums are looked up in the persistent cache first
+    and only missing checksums are calculated.
+
+    """
+    if config.CHECKSUM_CACHE_ROOT is None:
+        return _calculate_checksums(path, types)
+
+    stat = os.stat(path)
+    key = (path, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _checksum_cache() as db:
+        rows = db.execute(
+            'SELECT type, checksum FROM checksums '
+            'WHERE path = ? AND inode = ? AND size = ? AND mtime_ns = ?',
+            key,
+        )
+        checksums = dict(rows)
+        missing = [type for type in types if type not in checksums]
+        if missing:
+            calculated = _calculate_checksums(path, missing)
+            db.executemany(
+                'INSERT OR REPLACE INTO checksums '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                [
+                    (path, type, *key[1:], checksum)
+                    for type, checksum in calculated.items()
+                ],
+            )
+            # Replaced entries get a new rowid,
+            # so the smallest rowids belong to the oldest entries
+            db.execute(
+                'DELETE FROM checksums WHERE rowid <= '
+                '(SELECT MAX(rowid) FROM checksums) - ?',
+                (config.CHECKSUM_CACHE_SIZE,),
+            )
+            checksums.update(calculated)
+
+    return {type: checksums[type] for type in types}
+
+
+def _deploy_by_checksum(
+        path: ArtifactoryPath,
+        *,
+        sha1: str,
+        sha256: str,
+        parameters: typing.Dict,
+) -> bool:
+    r"""Deploy artifact by checksum without uploading its content.
+
+    Returns ``False``
+    if the server has no artifact with a matching checksum.
+
+    """
+    try:
+        path.deploy_by_checksum(
+            sha1=sha1,
+            sha256=sha256,
+            parameters=parameters,
+            quote_parameters=True,
+        )
+    except (
+            requests.exceptions.HTTPError,
+            dohq_artifactory.exception.ArtifactoryException,
+    ) as ex:
+        if _status_code(ex) == 404:
+            return False
+        raise  # pragma: no cover
+    return True
+
+
+def _deploy_file(
+        src_path: str,
+        dst_path: ArtifactoryPath,
+        *,
+        md5: str,
+        sha1: str,
+        sha256: str,
+        parameters: typing.Dict,
+        retries: int,
+):
+    r"""Upload file to Artifactory.
+
+    The checksums are sent with the upload,
+    so the server rejects an artifact
+    that does not match them
+    with status code 409.
+    The upload is repeated
+    in this case
+    and on connection errors.
+
+    """
+    for _ in range(retries + 1):
+        try:
+            with open(src_path, 'rb') as fobj:
+                dst_path.deploy(
+                    fobj,
+                    md5=md5,
+                    sha1=sha1,
+                    sha256=sha256,
+                    parameters=parameters,
+                    quote_parameters=True,
+                )
+            return
+        except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+        ) as ex:
+            error = ex
+        except (
+                requests.exceptions.HTTPError,
+                dohq_artifactory.exception.ArtifactoryException,
+        ) as ex:
+            if _status_code(ex) != 409:
+                raise
+            error = RuntimeError(
+                f"Checksum of deployed artifact '{dst_path}' "
+                f"does not match '{src_path}'."
+            )
+            error.__cause__ = ex
+    raise error
+
+
+def _download(
+        url: str,
+        destination: str,
+        *,
+        chunk: int,
+        verbose: bool,
+):
+    r"""Download artifact to temporary file and move it to destination."""
+    src_path = _path(url)
+    if not src_path.exists():
+        raise RuntimeError(f"Source '{url}' does not exists.")
+    src_size = ArtifactoryPath.stat(src_path).size
+    tmp_destination = f'{destination}.{audeer.uid()[:8]}.tmp'
+
+    with audeer.progress_bar(total=src_size, disable=not verbose) as pbar:
+        desc = audeer.format_display_message(
+            'Download {}'.format(os.path.basename(str(src_path))),
+            pbar=True,
+        )
+        pbar.set_description_str(desc)
+        pbar.refresh()
+
+        try:
+            dst_size = 0
+            with src_path.open() as src_fp:
+                with open(tmp_destination, 'wb') as dst_fp:
+                    while src_size > dst_size:
+                        data = src_fp.read(chunk)
+                        n_data = len(data)
+                        if n_data > 0:
+                            dst_fp.write(data)
+                            dst_size += n_data
+                            pbar.update(n_data)
+            os.replace(tmp_destination, destination)
+        except (KeyboardInterrupt, Exception):
+            # Clean up broken artifact files
+            if os.path.exists(tmp_destination):
+                os.remove(tmp_destination)  # pragma: no cover
+            raise
+
+
+@contextlib.contextmanager
+def _lock(
+        path: str,
+) -> typing.Iterator[bool]:
+    r"""Lock a file across processes and threads.
+
+    Yields ``True``
+    if the lock was held by another process or thread
+    and we had to wait for it.
+
+    """
+    lock = filelock.FileLock(f'{path}.lock')
+    try:
+        lock.acquire(timeout=0)
+        waited = False
+    except filelock.Timeout:
+        lock.acquire()
+        waited = True
+    try:
+        yield waited
+    finally:
+        # Remove lock file while we still hold the lock.
+        # Waiting processes and threads notice it
+        # and create a new one.
+        # Older versions of filelock might grant the lock
+        # on the removed file to a waiting process,
+        # which only results in a second download,
+        # as downloads are moved to their destination atomically
+        with contextlib.suppress(OSError):
+            os.remove(lock.lock_file)
+        lock.release()
+
+
+@functools.lru_cache()
+def _session(
+        username: str,
+        apikey: str,
+        verify: typing.Union[bool, str] = True,
+        cert: str = None,
+) -> requests.Session:
+    r"""Shared HTTP session of user.
+
+    Connections to the server are kept alive
+    and reused by all requests,
+    which avoids a new TCP and TLS handshake per request.
+    The connection pool is large enough
+    to serve several threads at once.
+
+    ``verify`` and ``cert``
+    are the TLS settings of the server
+    as returned by :func:`_tls_settings`.
+
+    """
+    session = requests.Session()
+    session.auth = (username, apikey)
+    session.verify = verify
+    session.cert = cert
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _status_code(
+        error: Exception,
+) -> typing.Optional[int]:
+    r"""HTTP status code of a failed request.
+
+    ``dohq-artifactory>=0.8`` wraps the original
+    :class:`requests.exceptions.HTTPError`,
+    so we follow the chain of exceptions
+    until we find a response.
+
+    """
+    while error is not None:
+        response = getattr(error, 'response', None)
+        if response is not None:
+            return response.status_code
+        error = error.__cause__
+    return None  # pragma: no cover
+
+
+def _tls_settings(
+        url: str,
+) -> typing.Tuple[typing.Union[bool, str], typing.Optional[str]]:
+    r"""TLS settings of server from config file.
+
+    Returns the ``verify`` and ``cert`` entries
+    of the server in :file:`~/.artifactory_python.cfg`,
+    or ``(True, None)``
+    if the server has no entry.
+
+    """
+    config_entry = get_global_config_entry(_strip_url(url))
+    if config_entry is None:
+        return True, None
+    return config_entry['verify'], config_entry['cert']
+
+
 def _strip_url(url):  # pragma: nocover
     r"""Returns a URL without http(s):// prefixes and ending /."""
     if url.startswith('http://'):
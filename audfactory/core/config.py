@@ -0,0 +1,66 @@
+import os
+
+
+class config:
+    r"""Get/set configuration values for the :mod:`audfactory` module.
+
+    You can change the configuration values after import,
+    by setting the attributes directly.
+    Caching related configuration values
+    are initialized from environment variables,
+    if they are set.
+
+    Examples:
+        >>> config.CHECKSUM_CACHE_SIZE
+        1000000
+
+    """
+
+    CHECKSUM_CACHE_ROOT = os.environ.get(
+        'AUDFACTORY_CHECKSUM_CACHE_ROOT',
+        None,
+    )
+    r"""Folder of persistent cache for checksums of local files.
+
+    Checksums are stored together with
+    path, inode, size, and modification time
+    of a file,
+    and are only reused
+    if none of them has changed.
+    If ``None``,
+    checksums are not cached.
+    The default value can be set
+    by the environment variable
+    ``AUDFACTORY_CHECKSUM_CACHE_ROOT``.
+
+    """
+
+    CHECKSUM_CACHE_SIZE = 1000000
+    r"""Maximum number of entries in checksum cache.
+
+    If the cache grows larger,
+    the oldest entries are removed.
+
+    """
+
+    LOOKUP_CACHE_ROOT = os.environ.get(
+        'AUDFACTORY_LOOKUP_CACHE_ROOT',
+        None,
+    )
+    r"""Folder of persistent cache for lookup tables.
+
+    Downloaded lookup tables are stored as JSON files
+    together with the SHA1 checksum
+    reported by the server,
+    and are only reused
+    if the checksum on the server has not changed.
+    This is revalidated by a single request
+    that does not transfer the table.
+    If ``None``,
+    lookup tables are not cached
+    between processes.
+    The default value can be set
+    by the environment variable
+    ``AUDFACTORY_LOOKUP_CACHE_ROOT``.
+
+    """
@@ -1,10 +1,25 @@
+import array
+import contextlib
 import csv
+import functools
+import hashlib
 import io
+import json
+import math
+import os
+import sys
+import time
 import typing
 
 import audeer
 
 import audfactory.core.api as audfactory
+from audfactory.core.config import config
+
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    import requests
 
 
 # Skip doctests until we have public lookup tables
@@ -12,6 +27,25 @@ __doctest_skip__ = ['*']
 
 
 LOOKUP_EXT = 'csv'
+LOOKUP_FORMATS = ['csv', 'json', 'log']
+MAX_CONFLICTS = 10
+_DELETE_MAX_ROWS = 100
+_REPR_MAX_ROWS = 20
+_TYPECODES = {bool: 'b', float: 'd', int: 'q'}
+
+
+def _operation(func: typing.Callable) -> typing.Callable:
+    r"""Decorate methods that change the lookup table.
+
+    The method is executed inside :meth:`Lookup.batch`,
+    and has to record its changes with :meth:`Lookup._record`.
+
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.batch():
+            return func(self, *args, **kwargs)
+    return wrapper
 
 
 class Lookup:
@@ -35,16 +69,70 @@ class Lookup:
     ``'4.0'``,
     and ``'4'``.
 
-    The following code converts an :class:`audfactory.Lookup` object
-    into a :class:`pandas.DataFrame`:
-
-    .. code-block:: python
-
-        index, data = [], []
-        if len(lookup.table) > 1:
-            index = [entry[0] for entry in lookup.table[1:]]
-            data = [entry[1:] for entry in lookup.table[1:]]
-        df = pd.DataFrame(data=data, index=index, columns=lookup.columns)
+    Use :meth:`audfactory.Lookup.to_dataframe`
+    to convert the lookup table
+    into a :class:`pandas.DataFrame`,
+    and :meth:`audfactory.Lookup.append_dataframe`
+    or :meth:`audfactory.Lookup.from_dataframe`
+    to add entries from a :class:`pandas.DataFrame`.
+    Those methods require :mod:`pandas` to be installed.
+
+    The lookup table is downloaded once
+    and kept in memory.
+    Before the table is accessed again,
+    a conditional request asks the server
+    if the table has changed,
+    and it is only downloaded again
+    if its checksum differs.
+    With ``max_age`` you can set a time span
+    in which the cached table is used
+    without asking the server.
+
+    If ``version`` is given,
+    the lookup table is downloaded on construction
+    to check that it exists.
+    Otherwise,
+    the latest version is selected
+    by listing the available versions once.
+    With ``lazy=True``
+    no request is sent on construction
+    and the table is only downloaded
+    when it is accessed the first time.
+
+    Lookup tables are stored as CSV files by default.
+    With ``format='json'``
+    in :meth:`audfactory.Lookup.create`
+    they are stored as JSON files instead,
+    which hold the values column by column
+    together with the type of every column.
+    They keep the types of the values
+    without converting them from strings
+    and load several times faster.
+    Use :meth:`audfactory.Lookup.convert`
+    to change the format of an existing lookup table.
+
+    With ``format='log'``
+    the lookup table is stored like with ``format='json'``,
+    but :meth:`audfactory.Lookup.append`
+    and :meth:`audfactory.Lookup.remove`
+    don't upload the whole table.
+    Instead,
+    they store a small delta record next to it,
+    which is applied when the table is loaded.
+    This way the cost of a change
+    does not grow with the size of the table.
+    Other changes,
+    like :meth:`audfactory.Lookup.extend`,
+    and :meth:`audfactory.Lookup.compact`
+    merge the delta records into the table again.
+    Loading the table
+    needs one more request than for the other formats
+    to list the delta records,
+    also on every revalidation with ``max_age=0``.
+    If an index was created
+    with :meth:`audfactory.Lookup.create_index`,
+    it is still rewritten with every change,
+    as it has to list all entries.
 
     Args:
         server: URL of Artifactory server,
@@ -53,10 +141,22 @@ class Lookup:
         group_id: group ID of lookup table
         name: name of lookup table
         version: version of lookup table
+        max_age: time in seconds
+            the cached lookup table is used
+            without checking if it has changed on the server
+        lazy: if ``True``
+            and ``version`` is given,
+            don't check if the lookup table exists
+        format: format of lookup table,
+            ``'csv'``, ``'json'``, or ``'log'``.
+            If ``None``
+            it is detected from the server,
+            or set to ``'csv'`` if ``lazy`` is ``True``
 
     Raises:
         RuntimeError: if no lookup tables or no lookup
             table with the specified version can be found
+        ValueError: if ``format`` is not supported
 
     Examples:
         >>> lookup = Lookup(
@@ -84,6 +184,9 @@ class Lookup:
             *,
             name: str = 'lookup',
             version: str = None,
+            max_age: float = 0,
+            lazy: bool = False,
+            format: str = None,
     ):
         self.server = server
         """server URL"""
@@ -94,43 +197,75 @@ class Lookup:
         self.repository = repository
         """repository of lookup table"""
 
+        if format is not None:
+            _check_format(format)
+        check_table = not lazy
         if version is None:
-            version = Lookup.latest_version(
-                server,
-                repository,
-                group_id,
-                name=name,
-            )
-
-        if version is None:
-            url = audfactory.url(
-                server,
-                repository=repository,
-                group_id=group_id,
-                name=name,
-            )
-            raise RuntimeError(
-                f"No lookup tables available under '{url}'"
-            )
-        elif not Lookup.exists(
-                server, repository, group_id, version, name=name
-        ):
-            url = audfactory.url(
-                server,
-                repository=repository,
-                group_id=group_id,
-                name=name,
-                version=version,
-            )
-            raise RuntimeError(
-                f"Lookup table '{url}/"
-                f"{name}-{version}.{LOOKUP_EXT}' does not exist yet."
-            )
+            versions = audfactory.versions(server, repository, group_id, name)
+            if len(versions) == 0:
+                url = audfactory.url(
+                    server,
+                    repository=repository,
+                    group_id=group_id,
+                    name=name,
+                )
+                raise RuntimeError(
+                    f"No lookup tables available under '{url}'"
+                )
+            version = versions[-1]
+            # Existence is known from listing,
+            # but the format might be unknown
+            check_table = check_table and format is None
 
         self.version = version
         """version of lookup table"""
-        self.url = _url_table(server, repository, group_id, name, version)
+        self.format = format or LOOKUP_EXT
+        """format of lookup table"""
+        self.url = _url_table(
+            server,
+            repository,
+            group_id,
+            name,
+            version,
+            self.format,
+        )
         """Artifactory URL of lookup table"""
+        self.max_age = max_age
+        """time in seconds cached lookup table is used without revalidation"""
+
+        self._table = None
+        self._sha1 = None
+        self._validated = None
+        self._uids = None
+        self._params = None
+        self._values = {}
+        self._batch = False
+        self._changed = False
+        self._changes = []
+        self._replaying = False
+        self._base = None
+        self._applied = []
+        self._owned = False
+
+        if check_table:
+            formats = LOOKUP_FORMATS if format is None else [format]
+            url, table, sha1 = _find_table(
+                server,
+                repository,
+                group_id,
+                name,
+                version,
+                formats=formats,
+            )
+            if url is None:
+                raise RuntimeError(
+                    f"Lookup table '{self.url}' does not exist yet."
+                )
+            self.url = url
+            self.format = _format(url)
+            self._set(table, sha1)
+            self._fold()
+            self._validated = time.monotonic()
 
     def __getitem__(self, uid: str) -> typing.Dict:
         r"""Get lookup table entry by ID.
@@ -142,18 +277,21 @@ class Lookup:
             lookup table entry
 
         """
-        table = self.table
-        columns = _columns(table)
-        item = {}
-        for row in table[1:]:
-            if row[0] == uid:
-                item = {c: p for c, p in zip(columns, row[1:])}
-                break
-        return item
+        return self.get_many([uid])[0]
 
     def __repr__(self):
-        r"""String representation of lokkup table."""
-        table = self.table
+        r"""String representation of lookup table.
+
+        Tables with more than 20 entries are truncated
+        to their first and last 10 entries.
+
+        """
+        table = self._load()
+        truncated = len(table) - 1 > _REPR_MAX_ROWS
+        if truncated:
+            half = _REPR_MAX_ROWS // 2
+            shown = [*range(half + 1), *range(len(table) - half, len(table))]
+            table = [list(table[n]) for n in shown]
         padding = 2
         # Longest string in each column
         transposed_table = [list(x) for x in zip(*table)]
@@ -169,25 +307,26 @@ class Lookup:
             )
             for row in table
         ]
+        if truncated:
+            row.insert(half + 1, '...')
         return '\n'.join(row)
 
     @property
     def columns(self) -> typing.List:
         r"""Lookup table column names."""
-        table = _download(self.url)
-        return _columns(table)
+        return _columns(self._load())
 
     @property
     def ids(self) -> typing.List:
         r"""Lookup table ids."""
-        table = _download(self.url)
-        return _ids(table)
+        return _ids(self._load())
 
     @property
     def table(self) -> typing.List[typing.List]:
         r"""Lookup table."""
-        return _download(self.url)
+        return [list(row) for row in self._load()]
 
+    @_operation
     def append(self, params: typing.Dict[str, typing.Any]) -> str:
         r"""Append entry to lookup table.
 
@@ -211,38 +350,183 @@ class Lookup:
             ValueError: if ``params`` contain unsupported data types
 
         """
-        table = self.table
-        columns = _columns(table)
-        _check_params_type(params)
-        params = dict(sorted(params.items()))
+        return self.append_many([params])[0]
+
+    @_operation
+    def append_dataframe(self, df: 'pd.DataFrame') -> typing.List[str]:
+        r"""Append entries from a data frame to lookup table.
 
-        if self.contains(params):
-            raise RuntimeError(f"Entry for '{params}' already exists.")
-        if list(params.keys()) != columns:
+        Every row of ``df`` is added as an entry,
+        its columns have to match the columns of the lookup table.
+        The index of ``df`` is ignored.
+        The values are converted column by column,
+        missing values are stored as ``None``.
+        The entries get the same unique IDs
+        as with :meth:`audfactory.Lookup.append_many`.
+
+        Args:
+            df: lookup table entries
+
+        Returns:
+            IDs of added lookup table entries
+
+        Raises:
+            RuntimeError: if an entry exists already,
+                is given twice,
+                or the columns of ``df`` do not match the columns
+                of the lookup
+            ValueError: if ``df`` contains unsupported data types
+
+        """
+        columns = self.columns
+        if sorted(df.columns) != columns:
             raise RuntimeError(
-                f"Table columns '{columns}' do not match parameters '{params}'"
+                f"Table columns '{columns}' "
+                f"do not match data frame columns '{list(df.columns)}'"
             )
+        values = []
+        for column in columns:
+            column_values = _import_series(df[column])
+            _check_column_type(column_values)
+            values.append(column_values)
+        keys = list(zip(*values)) if values else [()] * len(df)
 
-        # Add an UID to the new row and append it to the table
-        uid = self.generate_uid(
-            params=str(params),
-            group_id=self.group_id,
-            name=self.name,
-            version=self.version,
-            repository=self.repository,
-        )
-        new_row = [uid] + list(params.values())
-        table.append(new_row)
-        _upload(table, self.url)
+        return self._append_keys(columns, keys)
 
-        return uid
+    @_operation
+    def append_many(
+            self,
+            params: typing.Sequence[typing.Dict[str, typing.Any]],
+    ) -> typing.List[str]:
+        r"""Append several entries to lookup table.
+
+        All entries are validated first
+        and the lookup table is uploaded only once.
+        If one of the entries is invalid,
+        no entry is added.
+        See :meth:`audfactory.Lookup.append`
+        for how the unique IDs are generated.
+
+        Args:
+            params: lookup table entries
+                in the form of ``[{column: parameter}, ...]``
 
+        Returns:
+            IDs of added lookup table entries
+
+        Raises:
+            RuntimeError: if an entry exists already,
+                is given twice,
+                or its columns do not match the columns
+                of the lookup
+            ValueError: if ``params`` contain unsupported data types
+
+        """
+        columns = self.columns
+        keys = []
+        for entry in params:
+            _check_params_type(entry)
+            entry = dict(sorted(entry.items()))
+            if list(entry.keys()) != columns:
+                raise RuntimeError(
+                    f"Table columns '{columns}' "
+                    f"do not match parameters '{entry}'"
+                )
+            keys.append(_key(entry))
+
+        return self._append_keys(columns, keys)
+
+    @contextlib.contextmanager
+    def batch(self) -> typing.Iterator['Lookup']:
+        r"""Collect changes to lookup table and upload them once.
+
+        Inside the context
+        :meth:`audfactory.Lookup.append`,
+        :meth:`audfactory.Lookup.append_dataframe`,
+        :meth:`audfactory.Lookup.append_many`,
+        :meth:`audfactory.Lookup.clear`,
+        :meth:`audfactory.Lookup.drop_columns`,
+        :meth:`audfactory.Lookup.extend`,
+        :meth:`audfactory.Lookup.merge`,
+        :meth:`audfactory.Lookup.remove`,
+        and :meth:`audfactory.Lookup.remove_many`
+        change only the cached lookup table.
+        The lookup table is uploaded
+        when the context is left.
+        If an error is raised inside the context,
+        all changes are discarded
+        and nothing is uploaded.
+
+        Before uploading,
+        it is checked if the lookup table
+        was changed on the server in the meantime,
+        e.g. by another process appending to it.
+        In this case,
+        the new table is downloaded
+        and all changes of the batch are applied to it again,
+        so concurrent changes are not lost.
+        Outside of a batch,
+        every change is handled as a batch of its own.
+
+        Yields:
+            lookup table object
+
+        Examples:
+            >>> with lookup.batch():
+            ...     lookup.extend({'train-db2': None})
+            ...     lookup.remove(
+            ...         {
+            ...             'purpose': 'prod',
+            ...             'sampling_rate': 16000,
+            ...             'train-db': 'voxceleb1',
+            ...             'train-db2': None,
+            ...         }
+            ...     )
+            '3bb24968-759a-11ea-ab25-309c2364e602'
+
+        """
+        if self._batch:
+            # Nested batches are uploaded by the outermost one
+            yield self
+            return
+
+        table = self._load()
+        self._base = (table, self._sha1, list(self._applied))
+        self._owned = False
+        self._batch = True
+        self._changed = False
+        try:
+            yield self
+            if self._changed:
+                self._commit()
+        except BaseException:
+            table, sha1, applied = self._base
+            self._set(table, sha1)
+            self._applied = list(applied)
+            raise
+        finally:
+            self._batch = False
+            self._changes = []
+
+    @_operation
     def clear(self) -> None:
         r"""Clear lookup table."""
-        table = self.table
+        self._clear_rows()
+        self._record(self._clear_rows)
+
+    @_operation
+    def compact(self) -> None:
+        r"""Merge delta records into lookup table.
+
+        Applies to lookup tables stored with ``format='log'``,
+        for other formats nothing is done.
+        The lookup table is uploaded with all delta records applied,
+        and the delta records are removed afterwards.
 
-        table = [table[0]]  # empty table with header
-        _upload(table, self.url)
+        """
+        if self.format == 'log' and len(self._applied) > 0:
+            self._rewrite()
+            self._record(self._rewrite)
 
     def contains(self, params: typing.Dict[str, typing.Any]) -> bool:
         r"""Check if lookup table contains entry.
@@ -254,12 +538,128 @@ class Lookup:
             ``True`` if lookup table contains entry
 
         """
-        try:
-            self.find(params)
-        except RuntimeError:
-            return False
-        return True
+        return self._find(params) is not None
+
+    def copy_to(
+            self,
+            version: str,
+            *,
+            force: bool = False,
+            format: str = None,
+    ) -> 'Lookup':
+        r"""Copy lookup table to another version.
+
+        The lookup table is uploaded once
+        under the new version,
+        and the entries keep their IDs.
+
+        Args:
+            version: version of new lookup table
+            force: if ``True`` an existing lookup table is overwritten
+            format: format of new lookup table,
+                ``'csv'``, ``'json'``, or ``'log'``.
+                If ``None``
+                the format of the lookup table is used
+
+        Returns:
+            new lookup table
+
+        Raises:
+            RuntimeError: if lookup table exists already
+                and ``force=False``,
+                or if called inside :meth:`audfactory.Lookup.batch`
+            ValueError: if ``format`` is not supported
 
+        """
+        if self._batch:
+            # Copy would keep changes
+            # that are discarded if the batch fails
+            raise RuntimeError(
+                'Lookup table cannot be copied inside a batch.'
+            )
+        format = format or self.format
+        table = self._load()
+        _, sha1 = _create(
+            self.server,
+            self.repository,
+            self.group_id,
+            self.name,
+            version,
+            table,
+            force=force,
+            format=format,
+        )
+        lookup = Lookup(
+            self.server,
+            self.repository,
+            self.group_id,
+            name=self.name,
+            version=version,
+            max_age=self.max_age,
+            lazy=True,
+            format=format,
+        )
+        lookup._set(table, sha1)
+        lookup._validated = time.monotonic()
+        return lookup
+
+    def diff(self, other: 'Lookup') -> typing.Dict[str, typing.List[str]]:
+        r"""Compare entries with another lookup table.
+
+        Entries are matched by their ID.
+
+        Args:
+            other: lookup table to compare with
+
+        Returns:
+            dictionary with IDs of entries
+            only part of ``other`` (``'added'``),
+            only part of this lookup table (``'removed'``),
+            and part of both,
+            but with different parameters (``'changed'``)
+
+        """
+        table = self._load()
+        other_table = other._load()
+        other_keys = dict(zip(other_table.ids, other_table.keys()))
+        same_columns = _columns(table) == _columns(other_table)
+        removed = []
+        changed = []
+        for uid, key in zip(table.ids, table.keys()):
+            if uid not in other_keys:
+                removed.append(uid)
+            elif not same_columns or other_keys[uid] != key:
+                changed.append(uid)
+        uids = self._uid_index()
+        added = [uid for uid in other_table.ids if uid not in uids]
+        return {'added': added, 'removed': removed, 'changed': changed}
+
+    @_operation
+    def drop_columns(
+            self,
+            params: typing.Union[str, typing.Sequence[str]],
+    ):
+        r"""Remove columns from lookup table.
+
+        Columns that are not part of the lookup table are ignored.
+        The IDs of the entries are not changed.
+
+        Args:
+            params: ``[column]`` or ``column``
+
+        Raises:
+            RuntimeError: if entries would no longer be unique
+                after removing the columns
+
+        """
+        if isinstance(params, str):
+            params = [params]
+        params = list(params)
+        self._load()
+        self._drop_columns(params)
+        self._record(self._drop_columns, params)
+
+    @_operation
     def extend(
             self,
             params: typing.Union[
@@ -289,30 +689,39 @@ class Lookup:
         if isinstance(params, (tuple, list)):
             params = {param: None for param in params}
         _check_params_type(params)
+        self._record(self.extend, params)
 
-        table = self.table
-        columns = _columns(table)
-
-        for param, value in params.items():
-            if param not in columns:
-                # Append param key to columns
-                table[0] += [param]
-                # FIXME: the following code seems ugly to me
-                if len(table) == 1 and value is not None:
-                    # Start from empty table, by first updating the columns
-                    _upload(table, self.url)
-                    original_params = {p: None for p in columns}
-                    self.append({**original_params, **{param: value}})
-                    table = self.table
-                else:
-                    for n in range(len(table[1:])):
-                        # Append param value to every row
-                        table[n + 1] += [value]
-
-        table = _sort(table)
-        _upload(table, self.url)
-
-        return table
+        # Changes below are part of extend
+        # and must not be replayed on their own
+        replaying = self._replaying
+        self._replaying = True
+        try:
+            table = self.table
+            columns = _columns(table)
+
+            for param, value in params.items():
+                if param not in columns:
+                    # Append param key to columns
+                    table[0] += [param]
+                    # FIXME: the following code seems ugly to me
+                    if len(table) == 1 and value is not None:
+                        # Start from empty table,
+                        # by first updating the columns
+                        self._save(table)
+                        original_params = {p: None for p in columns}
+                        self.append({**original_params, **{param: value}})
+                        table = self.table
+                    else:
+                        for n in range(len(table[1:])):
+                            # Append param value to every row
+                            table[n + 1] += [value]
+
+            table = _sort(table)
+            self._save(table)
+        finally:
+            self._replaying = replaying
+
+        return [list(row) for row in table]
 
     def find(self, params: typing.Dict[str, typing.Any]) -> str:
         r"""Find entry in lookup table.
@@ -327,169 +736,1013 @@ class Lookup:
             RuntimeError: if lookup table entry cannot be found
 
         """
-        table = self.table
-        params = dict(sorted(params.items()))
-
-        for row in table[1:]:
-            uid = row[0]
-            entries = row[1:]
-            if entries == list(params.values()):
-                return uid
-
-        raise RuntimeError(
-            f"Could not find requested entry '{params}' "
-            f"in version {self.version}:\n\n{table}"
-        )
+        uid = self._find(params)
+        if uid is None:
+            params = dict(sorted(params.items()))
+            raise RuntimeError(
+                f"Could not find requested entry '{params}' "
+                f"in version {self.version}:\n\n{self._table}"
+            )
+        return uid
 
-    def remove(self, params: typing.Dict[str, typing.Any]) -> str:
-        r"""Remove entry from lookup table.
+    def get_many(self, uids: typing.Sequence[str]) -> typing.List[typing.Dict]:
+        r"""Get several lookup table entries by ID.
 
         Args:
-            params: lookup table entry in the form of ``{column: parameter}``
+            uids: IDs of lookup table entries
 
         Returns:
-            ID of removed entry
+            lookup table entries,
+            an empty dictionary is returned for an unknown ID
 
         """
-        table = self.table
-        uid = self.find(params)
-        for n in range(len(table)):
-            if table[n][0] == uid:
-                table.pop(n)
-                break
-        _upload(table, self.url)
+        table = self._load()
+        columns = _columns(table)
+        index = self._uid_index()
+        items = []
+        for uid in uids:
+            item = {}
+            if uid in index:
+                row = table[index[uid]]
+                item = {c: p for c, p in zip(columns, row[1:])}
+            items.append(item)
+        return items
 
-        return uid
+    def iter_rows(self) -> typing.Iterator[typing.List]:
+        r"""Iterate over rows of lookup table.
 
-    @staticmethod
-    def create(
-            server: str,
-            repository: str,
-            group_id: str,
-            version: str,
-            params: typing.Sequence[str] = (),
-            *,
-            name: str = 'lookup',
-            force: bool = False
-    ) -> str:
-        r"""Create lookup table on server.
+        Yields the same rows as :attr:`audfactory.Lookup.table`,
+        starting with the header.
+        If the cached lookup table is outdated
+        and stored as CSV file,
+        the rows are parsed while the file is downloaded,
+        and the table is not kept in memory.
+        Otherwise,
+        the rows are created one by one
+        from the cached lookup table.
+
+        Yields:
+            rows of lookup table
+
+        Raises:
+            RuntimeError: if lookup table cannot be downloaded
+
+        """
+        fresh = (
+            self._table is not None
+            and (
+                self._batch
+                or time.monotonic() - self._validated < self.max_age
+            )
+        )
+        if fresh or self.format != 'csv':
+            yield from self._load()
+            return
+
+        headers = None
+        if self._sha1 is not None:
+            headers = {'If-None-Match': self._sha1}
+        r = audfactory.rest_api_get(self.url, headers=headers, stream=True)
+        with r:
+            if r.status_code == 304:
+                self._validated = time.monotonic()
+                yield from self._table
+                return
+            _check_response(r, self.url)
+            r.encoding = 'utf-8'
+            lines = r.iter_lines(decode_unicode=True)
+            reader = csv.reader(lines, delimiter=',')
+            # Repeated values are converted only once
+            convert = functools.lru_cache(maxsize=4096)(_import_csv)
+            # iter_lines() returns an empty line
+            # if a chunk ends between '\r' and '\n'
+            rows = (row for row in reader if row)
+            yield [_import_csv(value) for value in next(rows)]
+            for row in rows:
+                yield [row[0], *map(convert, row[1:])]
+
+    @_operation
+    def merge(self, other: 'Lookup') -> typing.List[str]:
+        r"""Add entries of another lookup table.
+
+        Entries of ``other``
+        with an ID that is already part of the lookup table
+        are skipped.
+        All other entries are added with their IDs,
+        and the lookup table is uploaded once.
 
         Args:
-            server: URL of Artifactory server,
-                e.g. https://audeering.jfrog.io/artifactory
-            repository: repository of lookup table
-            group_id: group ID of lookup table
-            version: version of lookup table
-            params: lookup table column names
-            name: name of lookup table
-            force: if ``True`` an existing lookup table is overwritten
+            other: lookup table with entries to add
 
         Returns:
-            URL of lookup table
+            IDs of added entries
 
         Raises:
-            RuntimeError: if lookup table exists already
-                and ``force=False``
+            RuntimeError: if the columns of the lookup tables differ,
+                or an entry with the same parameters
+                but a different ID exists already
 
         """
-        ex = Lookup.exists(server, repository, group_id, version, name=name)
-        url = _url_table(server, repository, group_id, name, version)
-        if force or not ex:
-            table = [['id'] + sorted(params)]
-            _upload(table, url)
-        else:
+        table = self._load()
+        other_table = other._load()
+        columns = _columns(other_table)
+        if _columns(table) != columns:
             raise RuntimeError(
-                f"Lookup table '{name}-{version}' exists already."
+                f"Table columns '{_columns(table)}' "
+                f"do not match columns '{columns}' of other lookup table"
             )
-        return url
+        uids = self._uid_index()
+        rows = [
+            [uid, *key]
+            for uid, key in zip(other_table.ids, other_table.keys())
+            if uid not in uids
+        ]
+        self._append_rows(columns, rows)
+        self._record(self._append_rows, columns, rows)
 
-    @staticmethod
-    def delete(
-            server: str,
-            repository: str,
-            group_id: str,
-            version: str,
-            *,
-            name: str = 'lookup',
-            force: bool = True,
-    ) -> None:
-        r"""Delete lookup table on server.
+        return [row[0] for row in rows]
+
+    def query(self, params: typing.Dict[str, typing.Any]) -> typing.List[str]:
+        r"""Find all entries matching some parameters.
+
+        In contrast to :meth:`audfactory.Lookup.find`,
+        ``params`` can contain only a subset of the columns
+        and all matching entries are returned.
+        Each queried column is indexed on first use,
+        so repeated queries don't scan the whole table.
 
         Args:
-            server: URL of Artifactory server,
-                e.g. https://audeering.jfrog.io/artifactory
-            repository: repository of lookup table
-            group_id: group ID of lookup table
-            version: version of lookup table
-            name: name of lookup table
-            force: if ``True`` removes lookup table even if not empty
+            params: parameters in the form of ``{column: parameter}``
+
+        Returns:
+            IDs of matching lookup table entries
+            in the order they appear in the table
 
         Raises:
-            RuntimeError: if lookup table is not empty
-                and ``force=False``
+            RuntimeError: if ``params`` contain a column
+                that is not part of the lookup table
+
+        Examples:
+            >>> lookup.query({'sampling_rate': 16000})
+            ['3bb24968-759a-11ea-ab25-309c2364e602']
 
         """
-        lookup = Lookup(
-            server,
-            repository,
-            group_id,
-            name=name,
-            version=version,
-        )
-        if len(lookup.table) > 1:
-            if not force:
+        table = self._load()
+        columns = _columns(table)
+        for column in params:
+            if column not in columns:
                 raise RuntimeError(
-                    f"Cannot remove lookup table '{name}-{version}' "
-                    f"if it is not empty.")
-            lookup.clear()
-        audfactory.path(lookup.url).parent.rmdir()
+                    f"Table columns '{columns}' do not contain '{column}'"
+                )
+        if not params:
+            return _ids(table)
 
-    @staticmethod
-    def exists(
-            server: str,
-            repository: str,
-            group_id: str,
-            version: str,
-            *,
-            name: str = 'lookup',
-    ) -> bool:
-        r"""Check if lookup table exists on server.
+        rows = []
+        for column, value in params.items():
+            try:
+                rows.append(self._value_index(column).get(value, []))
+            except TypeError:
+                # Unhashable parameter values cannot be in the table
+                return []
+        # Intersect, starting with the smallest set of rows
+        rows = sorted(rows, key=len)
+        matches = set(rows[0])
+        for other in rows[1:]:
+            matches.intersection_update(other)
+        return [table.ids[n - 1] for n in sorted(matches)]
+
+    @_operation
+    def remove(self, params: typing.Dict[str, typing.Any]) -> str:
+        r"""Remove entry from lookup table.
 
         Args:
-            server: URL of Artifactory server,
-                e.g. https://audeering.jfrog.io/artifactory
-            repository: repository of lookup table
-            group_id: group ID of lookup table
-            version: version of lookup table
-            name: name of lookup table
+            params: lookup table entry in the form of ``{column: parameter}``
 
         Returns:
-            ``True`` if lookup table exists
+            ID of removed entry
 
-        Examples:
-            >>> Lookup.exists(
-            ...     'https://artifactory.audeering.com/artifactory',
-            ...     'models-public-local',
-            ...     'com.audeering.models.gender.voxcnn',
-            ...     '0.1.0',
-            ... )
-            True
+        Raises:
+            RuntimeError: if lookup table entry cannot be found
 
         """
-        versions = audfactory.versions(server, repository, group_id, name)
-        return version in versions
+        return self.remove_many([params])[0]
 
-    @staticmethod
-    def latest_version(
-            server: str,
-            repository: str,
-            group_id: str,
-            *,
-            params: typing.Dict[str, typing.Any] = None,
-            name: str = 'lookup',
+    @_operation
+    def remove_many(
+            self,
+            entries: typing.Sequence[
+                typing.Union[str, typing.Dict[str, typing.Any]]
+            ],
+    ) -> typing.List[str]:
+        r"""Remove several entries from lookup table.
+
+        The lookup table is uploaded only once.
+        If one of the entries cannot be found,
+        no entry is removed.
+
+        Args:
+            entries: IDs of lookup table entries
+                or entries in the form of ``{column: parameter}``
+
+        Returns:
+            IDs of removed entries
+
+        Raises:
+            RuntimeError: if an entry cannot be found
+
+        """
+        self._load()
+        uids = []
+        for entry in entries:
+            if isinstance(entry, str):
+                if entry not in self._uid_index():
+                    raise RuntimeError(
+                        f"Could not find requested ID '{entry}' "
+                        f"in version {self.version}."
+                    )
+                uids.append(entry)
+            else:
+                uids.append(self.find(entry))
+        self._remove_rows(uids)
+        self._record(self._remove_rows, uids)
+
+        return uids
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        r"""Convert lookup table to a data frame.
+
+        The data frame is built directly
+        from the columns of the cached lookup table.
+        Columns holding only
+        :class:`bool`,
+        :class:`float`,
+        or :class:`int`
+        values get the corresponding data type,
+        all other columns are of type ``object``.
+
+        Returns:
+            lookup table
+            with IDs as index named ``'id'``
+
+        """
+        import numpy as np
+        import pandas as pd
+
+        table = self._load()
+        index = pd.Index(table.ids, dtype=object, name='id')
+        data = {}
+        for column, values in zip(_columns(table), table._columns):
+            if isinstance(values, array.array):
+                dtype = bool if _is_bool(values) else values.typecode
+                values = np.array(values, dtype=dtype)
+            else:
+                dtype = object
+            data[column] = pd.Series(values, index=index, dtype=dtype)
+        return pd.DataFrame(data, index=index, columns=_columns(table))
+
+    def _append_keys(
+            self,
+            columns: typing.List[str],
+            keys: typing.Sequence[typing.Tuple],
+    ) -> typing.List[str]:
+        r"""Append entries given by their parameter values.
+
+        ``keys`` holds the validated parameter values
+        of every new entry
+        in the order of ``columns``.
+
+        """
+        index = self._params_index()
+
+        new_rows = []
+        new_keys = set()
+        for key in keys:
+            if key in index or key in new_keys:
+                entry = dict(zip(columns, key))
+                raise RuntimeError(f"Entry for '{entry}' already exists.")
+
+            # Add an UID to the new row
+            uid = self.generate_uid(
+                params=str(dict(zip(columns, key))),
+                group_id=self.group_id,
+                name=self.name,
+                version=self.version,
+                repository=self.repository,
+            )
+            new_keys.add(key)
+            new_rows.append([uid, *key])
+
+        self._append_rows(columns, new_rows)
+        self._record(self._append_rows, columns, new_rows)
+
+        return [row[0] for row in new_rows]
+
+    def _append_rows(
+            self,
+            columns: typing.List[str],
+            rows: typing.List[typing.List],
+    ):
+        r"""Append rows to cached lookup table.
+
+        Rows with an ID that is already part of the table are skipped,
+        so changes can be applied again to a newer table.
+
+        Raises:
+            RuntimeError: if columns of table changed,
+                or the table contains an entry
+                with same parameters but different ID
+
+        """
+        table = self._table
+        if _columns(table) != columns:
+            raise RuntimeError(
+                f"Table columns '{_columns(table)}' "
+                f"do not match parameters '{columns}'"
+            )
+        uids = self._uid_index()
+        index = self._params_index()
+        rows = [row for row in rows if row[0] not in uids]
+        for row in rows:
+            if tuple(row[1:]) in index:
+                entry = dict(zip(columns, row[1:]))
+                raise RuntimeError(f"Entry for '{entry}' already exists.")
+        if not rows:
+            return
+
+        start = len(table)
+        self._mutable_table().extend(rows)
+        # Rows were only appended,
+        # so we can extend the indices instead of rebuilding them
+        for n, row in enumerate(rows, start=start):
+            index.setdefault(tuple(row[1:]), row[0])
+            uids.setdefault(row[0], n)
+
+    def _clear_rows(self):
+        r"""Remove all rows from cached lookup table."""
+        self._save([list(self._table[0])])
+
+    def _commit(self):
+        r"""Upload changes of current batch.
+
+        As Artifactory does not support conditional uploads,
+        we check before and after uploading
+        if the lookup table on the server
+        still matches the one we expect.
+        If not,
+        the changes of the batch
+        are applied again
+        to the table from the server
+        and it is uploaded again.
+        This way,
+        changes of concurrent writers
+        don't overwrite each other,
+        unless they upload at exactly the same time.
+        For lookup tables stored with ``format='log'``,
+        delta records written after the table was loaded
+        are handled as a conflict as well.
+
+        Raises:
+            RuntimeError: if the lookup table was changed
+                by others more than :const:`MAX_CONFLICTS` times
+
+        """
+        if self.format == 'log' and all(
+                func in [self._append_rows, self._remove_rows]
+                for func, _ in self._changes
+        ):
+            self._commit_delta()
+            return
+
+        expected_sha1 = self._base[1]
+        uploaded = False
+        for _ in range(MAX_CONFLICTS):
+            table, sha1 = _download(self.url, sha1=expected_sha1)
+            applied = []
+            if (
+                    table is None
+                    and not uploaded
+                    and self.format == 'log'
+                    and set(_list_deltas(self.url)) - set(self._applied)
+            ):
+                # Delta records were written after the table was loaded,
+                # they would be applied to the uploaded table otherwise
+                table, sha1, applied = self._base
+            if table is not None:
+                # Conflict, apply all changes to table from server
+                if not self._replay(table, sha1, applied):
+                    # Server table contains all changes already
+                    break
+            elif uploaded:
+                break
+            expected_sha1 = _upload(self._table, self.url)
+            uploaded = True
+            self._set(self._table, expected_sha1)
+        else:  # pragma: no cover
+            raise RuntimeError(
+                f"Could not upload '{self.url}', "
+                f"it was changed by others {MAX_CONFLICTS} times."
+            )
+        self._validated = time.monotonic()
+        # Uploaded table contains all applied delta records
+        for url in self._applied:
+            with contextlib.suppress(FileNotFoundError):
+                audfactory.path(url).unlink()
+        self._applied = []
+        _update_index(
+            _url_index(self.server, self.repository, self.group_id, self.name),
+            self.version,
+            self._table,
+        )
+
+    def _commit_delta(self):
+        r"""Upload changes of current batch as delta record.
+
+        Used for lookup tables stored with ``format='log'``,
+        if the batch only appends or removes entries.
+        If the table was replaced on the server in the meantime,
+        e.g. by :meth:`audfactory.Lookup.extend`,
+        the changes are applied to the new table first,
+        so they are checked against its columns and entries.
+        An existing index is still downloaded and uploaded as a whole,
+        so it does not miss the changes.
+
+        """
+        table, sha1 = _download(self.url, sha1=self._base[1])
+        if table is not None and not self._replay(table, sha1, []):
+            # Server table contains all changes already
+            return
+        changes = []
+        for func, args in self._changes:
+            if func == self._append_rows:
+                changes.append(['append', *args])
+            else:
+                changes.append(['remove', *args])
+        self._applied.append(_upload_delta(changes, self.url))
+        # Table on server is unchanged
+        self._sha1 = self._base[1]
+        _update_index(
+            _url_index(self.server, self.repository, self.group_id, self.name),
+            self.version,
+            self._table,
+        )
+
+    def _drop_columns(self, params: typing.Sequence[str]):
+        r"""Remove columns from cached lookup table.
+
+        The remaining columns are reused
+        without converting their values.
+
+        Raises:
+            RuntimeError: if entries would no longer be unique
+
+        """
+        table = self._table
+        keep = [
+            n for n, column in enumerate(_columns(table))
+            if column not in params
+        ]
+        if len(keep) == len(table._columns):
+            return
+        header = [table.header[0]] + [table.header[n + 1] for n in keep]
+        columns = [table._columns[n] for n in keep]
+        table = _Table(header, table.ids, columns)
+        if len(set(table.keys())) < len(table.ids):
+            raise RuntimeError(
+                f"Cannot remove columns '{params}', "
+                f"as entries would no longer be unique."
+            )
+        self._save(table)
+
+    def _find(
+            self,
+            params: typing.Dict[str, typing.Any],
+    ) -> typing.Optional[str]:
+        r"""Find ID of entry in lookup table or return ``None``."""
+        self._load()
+        key = _key(params)
+        try:
+            return self._params_index().get(key)
+        except TypeError:
+            # Unhashable parameter values cannot be in the table
+            return None
+
+    def _load(self) -> typing.List[typing.List]:
+        r"""Return cached lookup table.
+
+        The table is revalidated
+        if it is older than :attr:`self.max_age`,
+        and downloaded again
+        if it has changed on the server.
+
+        """
+        now = time.monotonic()
+        if self._batch and self._table is not None:
+            # Don't overwrite changes of current batch
+            return self._table
+        if (
+                self._table is None
+                or now - self._validated >= self.max_age
+        ):
+            table, sha1 = _download(self.url, sha1=self._sha1)
+            if table is not None:
+                self._set(table, sha1)
+                self._applied = []
+            self._fold()
+            self._validated = now
+        return self._table
+
+    def _fold(self):
+        r"""Apply new delta records to cached lookup table.
+
+        Used for lookup tables stored with ``format='log'``.
+
+        """
+        if self.format != 'log':
+            return
+        table, applied = _fold_deltas(self.url, self._table, self._applied)
+        if len(applied) > len(self._applied):
+            self._set(table, self._sha1)
+            self._applied = applied
+
+    def _mutable_table(self) -> '_Table':
+        r"""Return cached lookup table to change it in place.
+
+        The table might be shared,
+        e.g. with the table at the start of the batch,
+        so it is copied on the first change
+        after it was replaced.
+        Indices of the table
+        have to be updated by the caller.
+
+        """
+        if not self._owned:
+            self._table = self._table.copy()
+            self._owned = True
+        self._sha1 = None
+        self._values = {}
+        self._changed = True
+        return self._table
+
+    def _record(self, func: typing.Callable, *args):
+        r"""Record change of current batch.
+
+        ``func(*args)`` is called
+        to apply the change again
+        after the lookup table was changed on the server,
+        so it should skip parts of the change
+        that are already part of the table.
+
+        """
+        if not self._replaying:
+            self._changes.append((func, args))
+
+    def _remove_rows(self, uids: typing.Sequence[str]):
+        r"""Remove rows from cached lookup table.
+
+        IDs that are not part of the table are ignored.
+
+        """
+        uids = set(uids)
+        table = self._table
+        rows = [n for n, uid in enumerate(table.ids) if uid in uids]
+        if not rows:
+            return
+        if self._params is not None:
+            # Update index instead of rebuilding it
+            for n in rows:
+                key = tuple(table[n + 1][1:])
+                if self._params.get(key) == table.ids[n]:
+                    del self._params[key]
+        self._mutable_table().remove(rows)
+        self._uids = None
+
+    def _replay(
+            self,
+            table: '_Table',
+            sha1: str,
+            applied: typing.Sequence[str],
+    ) -> bool:
+        r"""Apply changes of current batch again to another table.
+
+        ``applied`` lists the delta records
+        that are already part of ``table``,
+        new delta records are applied first.
+        The result is used as new base of the batch.
+        Returns ``True`` if the changes modified the table.
+
+        """
+        self._set(table, sha1)
+        self._applied = list(applied)
+        self._fold()
+        self._base = (self._table, sha1, list(self._applied))
+        self._changed = False
+        self._replaying = True
+        try:
+            for func, args in self._changes:
+                func(*args)
+        finally:
+            self._replaying = False
+        return self._changed
+
+    def _rewrite(self):
+        r"""Upload whole lookup table with current batch."""
+        self._changed = True
+
+    def _save(self, table: typing.List[typing.List]):
+        r"""Replace cached lookup table inside a batch.
+
+        The changed table is uploaded
+        when leaving :meth:`audfactory.Lookup.batch`.
+
+        """
+        if not isinstance(table, _Table):
+            table = _Table.from_rows(table)
+        if table == self._table:
+            return
+        self._set(table, None)
+        self._changed = True
+
+    def _set(self, table: '_Table', sha1: str):
+        r"""Replace cached lookup table and reset its indices."""
+        self._table = table
+        self._sha1 = sha1
+        self._owned = False
+        self._uids = None
+        self._params = None
+        self._values = {}
+
+    def _params_index(self) -> typing.Dict[typing.Tuple, str]:
+        r"""Map parameters to IDs of cached lookup table.
+
+        Parameters are given as tuple of values
+        sorted by column name,
+        see :func:`_key`.
+        The index is built on first access
+        after the cached table has changed.
+
+        """
+        if self._params is None:
+            self._params = {}
+            for uid, key in zip(self._table.ids, self._table.keys()):
+                self._params.setdefault(key, uid)
+        return self._params
+
+    def _value_index(
+            self,
+            column: str,
+    ) -> typing.Dict[typing.Any, typing.List[int]]:
+        r"""Map values of a column to row numbers of cached lookup table.
+
+        The index of a column is built on first access
+        after the cached table has changed.
+
+        """
+        if column not in self._values:
+            n = self._table.header.index(column)
+            index = {}
+            for m, value in enumerate(self._table.values(n), start=1):
+                index.setdefault(value, []).append(m)
+            self._values[column] = index
+        return self._values[column]
+
+    def _uid_index(self) -> typing.Dict[str, int]:
+        r"""Map IDs to row numbers of cached lookup table.
+
+        The index is built on first access
+        after the cached table has changed.
+
+        """
+        if self._uids is None:
+            self._uids = {}
+            for n, uid in enumerate(self._table.ids, start=1):
+                self._uids.setdefault(uid, n)
+        return self._uids
+
+    @staticmethod
+    def convert(
+            server: str,
+            repository: str,
+            group_id: str,
+            version: str,
+            format: str,
+            *,
+            name: str = 'lookup',
+    ) -> str:
+        r"""Convert lookup table on server to another format.
+
+        The lookup table is stored in the new format
+        and the file in the old format is removed.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            version: version of lookup table
+            format: new format of lookup table,
+                ``'csv'``, ``'json'``, or ``'log'``
+            name: name of lookup table
+
+        Returns:
+            URL of lookup table
+
+        Raises:
+            RuntimeError: if lookup table does not exist
+            ValueError: if ``format`` is not supported
+
+        """
+        _check_format(format)
+        lookup = Lookup(
+            server,
+            repository,
+            group_id,
+            name=name,
+            version=version,
+        )
+        url = _url_table(server, repository, group_id, name, version, format)
+        if url != lookup.url:
+            _upload(lookup._table, url)
+            for old_url in [lookup.url] + lookup._applied:
+                audfactory.path(old_url).unlink()
+        return url
+
+    @staticmethod
+    def create(
+            server: str,
+            repository: str,
+            group_id: str,
+            version: str,
+            params: typing.Sequence[str] = (),
+            *,
+            name: str = 'lookup',
+            force: bool = False,
+            format: str = LOOKUP_EXT,
+    ) -> str:
+        r"""Create lookup table on server.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            version: version of lookup table
+            params: lookup table column names
+            name: name of lookup table
+            force: if ``True`` an existing lookup table is overwritten
+            format: format of lookup table,
+                ``'csv'``, ``'json'``, or ``'log'``
+
+        Returns:
+            URL of lookup table
+
+        Raises:
+            RuntimeError: if lookup table exists already
+                and ``force=False``
+            ValueError: if ``format`` is not supported
+
+        """
+        table = [['id'] + sorted(params)]
+        url, _ = _create(
+            server,
+            repository,
+            group_id,
+            name,
+            version,
+            table,
+            force=force,
+            format=format,
+        )
+        return url
+
+    @staticmethod
+    def create_index(
+            server: str,
+            repository: str,
+            group_id: str,
+            *,
+            name: str = 'lookup',
+            num_workers: int = 8,
+    ) -> str:
+        r"""Create index of lookup tables on server.
+
+        The index is stored next to the versions of the lookup table
+        and lists the entries of all versions.
+        Once it exists,
+        it is updated whenever a lookup table is
+        created, changed, or deleted,
+        and :meth:`audfactory.Lookup.versions`
+        and :meth:`audfactory.Lookup.latest_version`
+        use it to find versions containing an entry
+        with a single download.
+        If the index exists already,
+        it is created again.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            name: name of lookup table
+            num_workers: number of lookup tables downloaded in parallel
+
+        Returns:
+            URL of index
+
+        """
+        versions = audfactory.versions(server, repository, group_id, name)
+        tables = []
+        if len(versions) > 0:
+            tasks = [
+                ([server, repository, group_id, name, v], {})
+                for v in versions
+            ]
+            tables = audeer.run_tasks(
+                _find_table,
+                tasks,
+                num_workers=num_workers,
+            )
+        index = [['version', 'id']]
+        for version, (url, table, _) in zip(versions, tables):
+            if table is None:
+                # Version folder without lookup table
+                continue
+            table, _ = _fold_deltas(url, table)
+            index += [[version] + row for row in table[1:]]
+        url = _url_index(server, repository, group_id, name)
+        _upload(index, url)
+        return url
+
+    @staticmethod
+    def delete(
+            server: str,
+            repository: str,
+            group_id: str,
+            version: str,
+            *,
+            name: str = 'lookup',
+            force: bool = True,
+    ) -> None:
+        r"""Delete lookup table on server.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            version: version of lookup table
+            name: name of lookup table
+            force: if ``True`` removes lookup table even if not empty
+
+        Raises:
+            RuntimeError: if lookup table does not exist
+            RuntimeError: if lookup table is not empty
+                and ``force=False``
+
+        """
+        url = _url_table(server, repository, group_id, name, version)
+        if not force:
+            table_url, table, _ = _find_table(
+                server,
+                repository,
+                group_id,
+                name,
+                version,
+            )
+            if table is not None:
+                table, _ = _fold_deltas(table_url, table)
+            if table is not None and len(table) > 1:
+                raise RuntimeError(
+                    f"Cannot remove lookup table '{name}-{version}' "
+                    f"if it is not empty.")
+        try:
+            audfactory.path(url).parent.rmdir()
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Lookup table '{url}' does not exist yet."
+            )
+        _update_index(
+            _url_index(server, repository, group_id, name),
+            version,
+            None,
+        )
+
+    @staticmethod
+    def exists(
+            server: str,
+            repository: str,
+            group_id: str,
+            version: str,
+            *,
+            name: str = 'lookup',
+    ) -> bool:
+        r"""Check if lookup table exists on server.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            version: version of lookup table
+            name: name of lookup table
+
+        Returns:
+            ``True`` if lookup table exists
+
+        Examples:
+            >>> Lookup.exists(
+            ...     'https://artifactory.audeering.com/artifactory',
+            ...     'models-public-local',
+            ...     'com.audeering.models.gender.voxcnn',
+            ...     '0.1.0',
+            ... )
+            True
+
+        """
+        versions = audfactory.versions(server, repository, group_id, name)
+        return version in versions
+
+    @staticmethod
+    def from_dataframe(
+            server: str,
+            repository: str,
+            group_id: str,
+            version: str,
+            df: 'pd.DataFrame',
+            *,
+            name: str = 'lookup',
+            force: bool = False,
+            format: str = LOOKUP_EXT,
+    ) -> 'Lookup':
+        r"""Create lookup table on server from a data frame.
+
+        The columns of ``df`` are used as columns of the lookup table,
+        and its rows are added as entries
+        with :meth:`audfactory.Lookup.append_dataframe`.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            version: version of lookup table
+            df: lookup table entries
+            name: name of lookup table
+            force: if ``True`` an existing lookup table is overwritten
+            format: format of lookup table,
+                ``'csv'``, ``'json'``, or ``'log'``
+
+        Returns:
+            lookup table
+
+        Raises:
+            RuntimeError: if lookup table exists already
+                and ``force=False``,
+                or ``df`` contains an entry twice
+            ValueError: if ``format`` is not supported,
+                or ``df`` contains unsupported data types
+
+        """
+        Lookup.create(
+            server,
+            repository,
+            group_id,
+            version,
+            list(df.columns),
+            name=name,
+            force=force,
+            format=format,
+        )
+        lookup = Lookup(
+            server,
+            repository,
+            group_id,
+            name=name,
+            version=version,
+            format=format,
+        )
+        lookup.append_dataframe(df)
+        return lookup
+
+    @staticmethod
+    def latest_version(
+            server: str,
+            repository: str,
+            group_id: str,
+            *,
+            params: typing.Dict[str, typing.Any] = None,
+            name: str = 'lookup',
+            num_workers: int = 8,
     ) -> typing.Optional[str]:
         r"""Latest version of lookup table on server.
 
+        If ``params`` is given
+        and the index created by :meth:`audfactory.Lookup.create_index`
+        does not exist,
+        lookup tables are downloaded
+        in chunks of ``num_workers`` versions,
+        starting with the newest version,
+        until a table containing the entry is found.
+
         Args:
             server: URL of Artifactory server,
                 e.g. https://audeering.jfrog.io/artifactory
@@ -497,6 +1750,7 @@ class Lookup:
             group_id: group ID of lookup table
             params: lookup table entry in the form of ``{column: parameter}``
             name: name of lookup table
+            num_workers: number of lookup tables downloaded in parallel
 
         Returns:
             latest version of lookup table
@@ -510,11 +1764,31 @@ class Lookup:
             '0.2.0'
 
         """
-        v = Lookup.versions(server, repository, group_id, params, name=name)
-        if len(v) > 0:
-            return v[-1]
-        else:
-            return None
+        versions = audfactory.versions(server, repository, group_id, name)
+        if params is not None:
+            index, _ = _download(
+                _url_index(server, repository, group_id, name),
+                missing_ok=True,
+            )
+            if index is not None:
+                versions = _filter_index(index, versions, params)
+                params = None
+        if params is None:
+            return versions[-1] if versions else None
+        versions = versions[::-1]
+        for n in range(0, len(versions), num_workers):
+            matches = _filter_versions(
+                server,
+                repository,
+                group_id,
+                name,
+                versions[n:n + num_workers],
+                params,
+                num_workers=num_workers,
+            )
+            if matches:
+                return matches[0]
+        return None
 
     @staticmethod
     def generate_uid(
@@ -563,6 +1837,99 @@ class Lookup:
         uid = audeer.uid(from_string=unique_string)
         return uid
 
+    @staticmethod
+    def search(
+            server: str,
+            repository: str,
+            group_ids: typing.Union[str, typing.Sequence[str]],
+            params: typing.Dict[str, typing.Any],
+            *,
+            name: str = 'lookup',
+            num_workers: int = 8,
+    ) -> typing.List[typing.Tuple[str, str, str]]:
+        r"""Find entry in lookup tables of several group IDs.
+
+        The versions of all group IDs are listed in parallel.
+        For group IDs with an index
+        created by :meth:`audfactory.Lookup.create_index`,
+        the entries are read from the index.
+        Otherwise,
+        the lookup tables of all their versions
+        are downloaded in parallel
+        over the shared HTTP session.
+        If :attr:`audfactory.config.LOOKUP_CACHE_ROOT` is set,
+        unchanged lookup tables are read from the persistent cache.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup tables
+            group_ids: group IDs of lookup tables
+            params: lookup table entry in the form of ``{column: parameter}``
+            name: name of lookup tables
+            num_workers: number of requests sent in parallel
+
+        Returns:
+            group ID, version, and ID
+            of every lookup table entry matching ``params``,
+            in the order of ``group_ids`` and versions
+
+        Examples:
+            >>> Lookup.search(
+            ...     'https://artifactory.audeering.com/artifactory',
+            ...     'models-public-local',
+            ...     [
+            ...         'com.audeering.models.gender.voxcnn',
+            ...         'com.audeering.models.age.voxcnn',
+            ...     ],
+            ...     {
+            ...         'purpose': 'prod',
+            ...         'sampling_rate': 16000,
+            ...         'train-db': 'voxceleb1',
+            ...     },
+            ... )
+            [('com.audeering.models.gender.voxcnn',
+              '0.2.0',
+              '3bb24968-759a-11ea-ab25-309c2364e602')]
+
+        """
+        if isinstance(group_ids, str):
+            group_ids = [group_ids]
+        group_ids = list(dict.fromkeys(group_ids))
+        if len(group_ids) == 0:
+            return []
+
+        tasks = [
+            ([server, repository, group_id, name, params], {})
+            for group_id in group_ids
+        ]
+        groups = audeer.run_tasks(
+            _search_group,
+            tasks,
+            num_workers=num_workers,
+        )
+        matches = {
+            group_id: [(group_id, version, uid) for version, uid in found]
+            for group_id, (found, _) in zip(group_ids, groups)
+        }
+
+        scan = [
+            (group_id, version)
+            for group_id, (_, versions) in zip(group_ids, groups)
+            for version in versions
+        ]
+        if len(scan) > 0:
+            tasks = [
+                ([server, repository, group_id, name, version, params], {})
+                for group_id, version in scan
+            ]
+            uids = audeer.run_tasks(_find_uid, tasks, num_workers=num_workers)
+            for (group_id, version), uid in zip(scan, uids):
+                if uid is not None:
+                    matches[group_id].append((group_id, version, uid))
+
+        return [match for group_id in group_ids for match in matches[group_id]]
+
     @staticmethod
     def versions(
             server: str,
@@ -571,44 +1938,291 @@ class Lookup:
             params: typing.Dict[str, typing.Any] = None,
             *,
             name: str = 'lookup',
+            num_workers: int = 8,
     ) -> list:
         r"""Available versions of lookup table on server.
 
-        Args:
-            server: URL of Artifactory server,
-                e.g. https://audeering.jfrog.io/artifactory
-            repository: repository of lookup table
-            group_id: group ID of lookup table
-            params: lookup table entry in the form of ``{column: parameter}``
-            name: name of lookup table
+        If ``params`` is given,
+        the versions containing the entry
+        are read from the index
+        created by :meth:`audfactory.Lookup.create_index`.
+        If the index does not exist,
+        the lookup tables of all versions
+        are downloaded in parallel
+        to check if they contain the entry.
+
+        Args:
+            server: URL of Artifactory server,
+                e.g. https://audeering.jfrog.io/artifactory
+            repository: repository of lookup table
+            group_id: group ID of lookup table
+            params: lookup table entry in the form of ``{column: parameter}``
+            name: name of lookup table
+            num_workers: number of lookup tables downloaded in parallel
+
+        Returns:
+            available versions of lookup table
+
+        Examples:
+            >>> Lookup.versions(
+            ...     'https://artifactory.audeering.com/artifactory',
+            ...     'models-public-local',
+            ...     'com.audeering.models.gender.voxcnn',
+            ... )
+            ['0.1.0', '0.2.0']
+
+        """
+        versions = audfactory.versions(server, repository, group_id, name)
+        if params is not None:
+            index, _ = _download(
+                _url_index(server, repository, group_id, name),
+                missing_ok=True,
+            )
+            if index is not None:
+                versions = _filter_index(index, versions, params)
+            else:
+                versions = _filter_versions(
+                    server,
+                    repository,
+                    group_id,
+                    name,
+                    versions,
+                    params,
+                    num_workers=num_workers,
+                )
+        return versions
+
+
+class _Row:
+    r"""View on a row of a :class:`_Table`."""
+
+    __slots__ = ('_table', '_n')
+
+    def __init__(self, table: '_Table', n: int):
+        self._table = table
+        self._n = n
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        return self._table.value(self._n, index)
+
+    def __iter__(self):
+        return (self._table.value(self._n, m) for m in range(len(self)))
+
+    def __len__(self):
+        return len(self._table.header)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _Table:
+    r"""Compact column store of a lookup table.
+
+    It behaves like the list of rows it was created from,
+    with the header as first row,
+    but stores the values column by column.
+    Columns holding only int, float, or bool values
+    are stored as :class:`array.array`,
+    other columns as lists with interned strings.
+    A single row is returned as a view,
+    slices and iteration create the row lists on demand.
+
+    A table might be shared
+    and is not changed in place,
+    unless it was created with :meth:`copy`.
+    Rows are then appended with :meth:`extend`
+    and removed with :meth:`remove`
+    without encoding the columns again.
+
+    """
+
+    __slots__ = ('header', 'ids', '_columns')
+
+    def __init__(
+            self,
+            header: typing.List[str],
+            ids: typing.List[str],
+            columns: typing.List[typing.Sequence],
+    ):
+        self.header = header
+        self.ids = ids
+        self._columns = columns
+
+    def __eq__(self, other):
+        if not isinstance(other, _Table):
+            other = _Table.from_rows(other)
+        # Columns with the same values
+        # might be stored in different containers
+        return (
+            self.header == other.header
+            and self.ids == other.ids
+            and all(
+                a == b if type(a) is type(b) else list(a) == list(b)
+                for a, b in zip(self._columns, other._columns)
+            )
+        )
+
+    __hash__ = None
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('table index out of range')
+        if index == 0:
+            return list(self.header)
+        return _Row(self, index - 1)
+
+    def __iter__(self):
+        yield list(self.header)
+        for row in zip(self.ids, *self._decoded()):
+            yield list(row)
+
+    def __len__(self):
+        return len(self.ids) + 1
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def copy(self) -> '_Table':
+        r"""Copy of table that can be changed in place."""
+        return _Table(
+            list(self.header),
+            list(self.ids),
+            [values[:] for values in self._columns],
+        )
+
+    def extend(self, rows: typing.Sequence[typing.Sequence]):
+        r"""Append rows in place.
+
+        A column stays a typed array
+        if the new values have the same type,
+        otherwise it is converted to a list.
+
+        """
+        self.ids.extend(row[0] for row in rows)
+        for n, values in enumerate(self._columns):
+            self._columns[n] = _extend(values, [row[n + 1] for row in rows])
+
+    def keys(self) -> typing.Iterator[typing.Tuple]:
+        r"""Parameter values of every row as tuple."""
+        if len(self._columns) == 0:
+            return iter([()] * len(self.ids))
+        return zip(*self._decoded())
 
-        Returns:
-            available versions of lookup table
+    def types(self) -> typing.List[str]:
+        r"""Type names of parameter columns.
 
-        Examples:
-            >>> Lookup.versions(
-            ...     'https://artifactory.audeering.com/artifactory',
-            ...     'models-public-local',
-            ...     'com.audeering.models.gender.voxcnn',
-            ... )
-            ['0.1.0', '0.2.0']
+        ``'bool'``, ``'float'``, ``'int'``
+        for columns stored in typed arrays,
+        ``'object'`` otherwise.
 
         """
-        versions = audfactory.versions(server, repository, group_id, name)
-        if params is not None:
-            filtered_versions = []
-            for version in versions:
-                lookup = Lookup(
-                    server,
-                    repository,
-                    group_id,
-                    name=name,
-                    version=version,
+        names = {code: t.__name__ for t, code in _TYPECODES.items()}
+        return [
+            names[values.typecode]
+            if isinstance(values, array.array) else 'object'
+            for values in self._columns
+        ]
+
+    def remove(self, rows: typing.Sequence[int]):
+        r"""Remove rows in place, counted without header.
+
+        ``rows`` have to be sorted.
+        Columns keep their type.
+
+        """
+        if len(rows) > _DELETE_MAX_ROWS:
+            # Deleting a row moves all following values,
+            # so we rather copy the remaining rows
+            remove = set(rows)
+            table = self.take(
+                [n for n in range(len(self.ids)) if n not in remove]
+            )
+            self.ids = table.ids
+            self._columns = table._columns
+            return
+        for n in reversed(rows):
+            del self.ids[n]
+            for values in self._columns:
+                del values[n]
+
+    def take(self, rows: typing.Sequence[int]) -> '_Table':
+        r"""Table with selected rows, counted without header.
+
+        Columns keep their type.
+
+        """
+        ids = [self.ids[n] for n in rows]
+        columns = []
+        for values in self._columns:
+            selected = [values[m] for m in rows]
+            if isinstance(values, array.array):
+                selected = array.array(values.typecode, selected)
+            columns.append(selected)
+        return _Table(self.header, ids, columns)
+
+    def value(self, row: int, column: int) -> typing.Any:
+        r"""Value of a cell, counted without header row."""
+        if column == 0:
+            return self.ids[row]
+        value = self._columns[column - 1][row]
+        if _is_bool(self._columns[column - 1]):
+            value = bool(value)
+        return value
+
+    def values(self, column: int) -> typing.List:
+        r"""Values of a parameter column, counted with ID column."""
+        return list(self._decoded()[column - 1])
+
+    def _decoded(self) -> typing.List[typing.Iterable]:
+        return [
+            map(bool, values) if _is_bool(values) else values
+            for values in self._columns
+        ]
+
+    @staticmethod
+    def from_columns(
+            header: typing.List[str],
+            columns: typing.List[typing.List],
+            types: typing.List[str],
+    ) -> '_Table':
+        r"""Create table from columns with types from :meth:`types`."""
+        codes = {t.__name__: code for t, code in _TYPECODES.items()}
+        encoded = []
+        for values, name in zip(columns[1:], types):
+            if name in codes:
+                encoded.append(array.array(codes[name], values))
+            else:
+                encoded.append(
+                    [sys.intern(v) if type(v) is str else v for v in values]
                 )
-                if lookup.contains(params):
-                    filtered_versions.append(version)
-            versions = filtered_versions
-        return versions
+        return _Table(header, columns[0], encoded)
+
+    @staticmethod
+    def from_rows(rows: typing.Sequence[typing.Sequence]) -> '_Table':
+        r"""Create table from list of rows."""
+        header = list(rows[0])
+        body = rows[1:]
+        if len(body) == 0:
+            return _Table(header, [], [[] for _ in header[1:]])
+        columns = list(zip(*body))
+        return _Table(
+            header,
+            list(columns[0]),
+            [_encode(values) for values in columns[1:]],
+        )
 
 
 def _check_params_type(params):
@@ -648,12 +2262,328 @@ def _check_params_type(params):
                 )
 
 
+def _check_column_type(values: typing.Sequence):
+    r"""Raise error if column includes wrong data types.
+
+    Like :func:`_check_params_type`,
+    but every string is checked only once
+    and other values only once per type.
+
+    """
+    samples = {}
+    strings = set()
+    for value in values:
+        if isinstance(value, str):
+            strings.add(value)
+        else:
+            samples.setdefault(type(value), value)
+    _check_params_type(dict(enumerate([*samples.values(), *strings])))
+
+
 def _columns(table: typing.List[typing.List]) -> typing.List:
     return table[0][1:]
 
 
-def _ids(table: typing.List[typing.List]) -> typing.List:
-    return [row[0] for row in table[1:]]
+def _create(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        version: str,
+        table: typing.List[typing.List],
+        *,
+        force: bool,
+        format: str,
+) -> typing.Tuple[str, str]:
+    r"""Upload new lookup table.
+
+    Returns URL and SHA1 checksum of lookup table.
+
+    """
+    _check_format(format)
+    ex = Lookup.exists(server, repository, group_id, version, name=name)
+    url = _url_table(server, repository, group_id, name, version, format)
+    if ex and not force:
+        raise RuntimeError(
+            f"Lookup table '{name}-{version}' exists already."
+        )
+    if ex:
+        # Remove existing table, which might have another format
+        audfactory.path(url).parent.rmdir()
+    sha1 = _upload(table, url)
+    _update_index(
+        _url_index(server, repository, group_id, name),
+        version,
+        table,
+    )
+    return url, sha1
+
+
+def _encode(values: typing.Sequence) -> typing.Sequence:
+    r"""Store values of a column compactly.
+
+    Values of a single type int, float, or bool
+    are stored in a typed array,
+    otherwise a list is used
+    and strings are interned,
+    so repeated parameter values share memory.
+
+    """
+    types = set(map(type, values))
+    if len(types) == 1:
+        typecode = _TYPECODES.get(types.pop())
+        if typecode is not None:
+            try:
+                return array.array(typecode, values)
+            except OverflowError:
+                # int too large for 64 bit
+                pass
+    return [sys.intern(v) if type(v) is str else v for v in values]
+
+
+def _extend(values: typing.Sequence, new: typing.List) -> typing.Sequence:
+    r"""Append values to column stored by :func:`_encode`.
+
+    The column is changed in place if possible.
+
+    """
+    if len(values) == 0:
+        return _encode(new)
+    if isinstance(values, array.array):
+        size = len(values)
+        if all(_TYPECODES.get(type(v)) == values.typecode for v in new):
+            try:
+                values.extend(new)
+                return values
+            except OverflowError:
+                # int too large for 64 bit
+                del values[size:]
+        values = list(map(bool, values)) if _is_bool(values) else list(values)
+    values.extend(sys.intern(v) if type(v) is str else v for v in new)
+    return values
+
+
+def _ids(table: _Table) -> typing.List:
+    return list(table.ids)
+
+
+def _cache_load(
+        url: str,
+) -> typing.Optional[
+    typing.Tuple[typing.Union[_Table, typing.List[typing.List]], str]
+]:
+    r"""Load table and its SHA1 checksum from persistent cache.
+
+    Returns ``None``
+    if :attr:`audfactory.config.LOOKUP_CACHE_ROOT` is not set,
+    or the table is not cached.
+
+    """
+    if config.LOOKUP_CACHE_ROOT is None:
+        return None
+    try:
+        with open(_cache_path(url), 'rb') as fp:
+            header = json.loads(fp.readline())
+            text = fp.read().decode('utf-8')
+        sha1 = header['sha1']
+        if header['rows']:
+            table = json.loads(text)
+        else:
+            table = _parse_json(text)
+    except FileNotFoundError:
+        return None
+    except (KeyError, TypeError, ValueError):
+        # Broken entry, or written by another version of audfactory
+        return None
+    return table, sha1
+
+
+def _cache_path(url: str) -> str:
+    r"""Path of lookup table in persistent cache."""
+    root = audeer.mkdir(audeer.safe_path(config.LOOKUP_CACHE_ROOT))
+    name = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return os.path.join(root, f'{name}.json')
+
+
+def _cache_save(
+        url: str,
+        table: typing.Union[_Table, typing.List[typing.List]],
+        sha1: str,
+):
+    r"""Store table and its SHA1 checksum in persistent cache.
+
+    The entry is a JSON file,
+    so reading it cannot execute code
+    written to a shared cache folder.
+    Its first line holds the checksum,
+    followed by the table as written by :func:`_export_json`,
+    or as list of rows
+    for tables with rows of different length.
+
+    The entry is written to a tmp file first
+    and moved to its final location afterwards,
+    so concurrent readers never see a partially written entry.
+    Concurrent writers of the same table
+    each replace the whole entry.
+
+    """
+    if config.LOOKUP_CACHE_ROOT is None:
+        return
+    path = _cache_path(url)
+    tmp_path = f'{path}.{audeer.uid()[:8]}.tmp'
+    rows = not isinstance(table, _Table)
+    header = json.dumps({'sha1': sha1, 'rows': rows})
+    if rows:
+        content = json.dumps(table, separators=(',', ':')).encode('utf-8')
+    else:
+        content = _export_json(table)
+    try:
+        with open(tmp_path, 'wb') as fp:
+            fp.write(f'{header}\n'.encode('utf-8'))
+            fp.write(content)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)  # pragma: no cover
+
+
+def _check_response(r: 'requests.Response', url: str):
+    r"""Raise error if download of lookup table failed."""
+    code = r.status_code
+    if code in [403, 404]:
+        raise RuntimeError(
+            f"{code}, URL not found or no access rights: '{url}'"
+        )
+    elif code != 200:  # pragma: no cover
+        raise RuntimeError(
+            f"{code}, problem downloading '{url}'.\n{audfactory.REPORT_ISSUE}"
+        )
+
+
+def _check_format(format: str):
+    r"""Raise error if format of lookup table is not supported."""
+    if format not in LOOKUP_FORMATS:
+        raise ValueError(
+            f"Lookup table format '{format}' is not supported, "
+            f"use one of {LOOKUP_FORMATS}."
+        )
+
+
+def _apply_delta(table: _Table, changes: typing.List) -> _Table:
+    r"""Apply changes of delta records to table.
+
+    A delta record holds a list of changes,
+    ``['append', columns, rows]``
+    or ``['remove', ids]``.
+    Like for :meth:`Lookup._append_rows`
+    rows with an ID that is already part of the table are skipped.
+    If the columns of the table were extended
+    after the delta record was written,
+    the new columns are set to ``None``.
+
+    All changes are collected first,
+    and the table is copied and changed only once.
+
+    """
+    columns = _columns(table)
+    uids = set(table.ids)
+    removed = set()
+    appended = {}
+    for change in changes:
+        if change[0] == 'append':
+            for row in change[2]:
+                uid = row[0]
+                if uid in appended or (uid in uids and uid not in removed):
+                    continue
+                if change[1] != columns:
+                    params = dict(zip(change[1], row[1:]))
+                    row = [uid] + [params.get(column) for column in columns]
+                appended[uid] = row
+        else:
+            for uid in change[1]:
+                if uid in appended:
+                    del appended[uid]
+                elif uid in uids:
+                    removed.add(uid)
+    if not removed and not appended:
+        return table
+    table = table.copy()
+    if removed:
+        table.remove([n for n, uid in enumerate(table.ids) if uid in removed])
+    table.extend(list(appended.values()))
+    return table
+
+
+def _contains(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        version: str,
+        params: typing.Dict[str, typing.Any],
+) -> bool:
+    r"""Check if lookup table on server contains entry."""
+    uid = _find_uid(server, repository, group_id, name, version, params)
+    return uid is not None
+
+
+def _filter_versions(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        versions: typing.Sequence[str],
+        params: typing.Dict[str, typing.Any],
+        *,
+        num_workers: int,
+) -> typing.List[str]:
+    r"""Versions of lookup tables that contain entry.
+
+    The tables are downloaded in parallel
+    over the shared HTTP session.
+
+    """
+    if len(versions) == 0:
+        return []
+    tasks = [
+        ([server, repository, group_id, name, version, params], {})
+        for version in versions
+    ]
+    found = audeer.run_tasks(_contains, tasks, num_workers=num_workers)
+    return [version for version, f in zip(versions, found) if f]
+
+
+def _export_json(table: typing.Sequence[typing.Sequence]) -> bytes:
+    r"""Convert table to JSON file content.
+
+    The JSON file holds the header,
+    the type of every parameter column
+    (``'bool'``, ``'float'``, ``'int'``, or ``'object'``),
+    and the values column by column,
+    starting with the IDs.
+
+    """
+    if not isinstance(table, _Table):
+        table = _Table.from_rows(table)
+    data = {
+        'header': table.header,
+        'types': table.types(),
+        'columns': [table.ids] + [
+            table.values(n) for n in range(1, len(table.header))
+        ],
+    }
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _filter_index(
+        index: typing.List[typing.List],
+        versions: typing.Sequence[str],
+        params: typing.Dict[str, typing.Any],
+) -> typing.List[str]:
+    r"""Versions that contain entry according to index."""
+    key = _key(params)
+    found = {row[0] for row in index[1:] if tuple(row[2:]) == key}
+    return [version for version in versions if version in found]
 
 
 def _import_csv(s):
@@ -677,25 +2607,306 @@ def _import_csv(s):
     return s
 
 
-def _download(url: str) -> typing.List[typing.List]:
-    r = audfactory.rest_api_get(url)
+def _find_table(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        version: str,
+        *,
+        formats: typing.Sequence[str] = LOOKUP_FORMATS,
+) -> typing.Tuple[typing.Optional[str], typing.Optional[_Table], str]:
+    r"""Download lookup table in the first format that exists.
+
+    Returns URL, table, and SHA1 checksum,
+    or ``(None, None, None)``
+    if the table does not exist in any of the formats.
+
+    """
+    for format in formats:
+        url = _url_table(server, repository, group_id, name, version, format)
+        table, sha1 = _download(url, missing_ok=True)
+        if table is not None:
+            return url, table, sha1
+    return None, None, None
+
+
+def _find_uid(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        version: str,
+        params: typing.Dict[str, typing.Any],
+) -> typing.Optional[str]:
+    r"""ID of entry in lookup table on server or ``None``."""
+    url, table, _ = _find_table(server, repository, group_id, name, version)
+    if table is None:
+        return None
+    table, _ = _fold_deltas(url, table)
+    key = _key(params)
+    for uid, values in zip(table.ids, table.keys()):
+        if values == key:
+            return uid
+    return None
+
+
+def _fold_deltas(
+        url: str,
+        table: _Table,
+        applied: typing.Sequence[str] = (),
+        *,
+        num_workers: int = 8,
+) -> typing.Tuple[_Table, typing.List[str]]:
+    r"""Apply delta records of lookup table on server.
+
+    Delta records listed in ``applied`` are skipped,
+    the others are downloaded in parallel
+    over the shared HTTP session.
+    Nothing is done for formats other than ``'log'``.
+    Returns the table
+    and the URLs of all applied delta records.
+
+    """
+    applied = list(applied)
+    if _format(url) != 'log':
+        return table, applied
+    urls = [
+        delta_url for delta_url in _list_deltas(url)
+        if delta_url not in applied
+    ]
+    if len(urls) == 0:
+        return table, applied
+    deltas = audeer.run_tasks(
+        _download_delta,
+        [([delta_url], {}) for delta_url in urls],
+        num_workers=num_workers,
+    )
+    changes = []
+    for delta_url, delta in zip(urls, deltas):
+        if delta is None:  # pragma: no cover
+            # Merged into table by another process in the meantime
+            continue
+        changes += delta
+        applied.append(delta_url)
+    return _apply_delta(table, changes), applied
+
+
+def _format(url: str) -> str:
+    r"""Format of lookup table from its URL."""
+    return url.rsplit('.', 1)[-1]
+
+
+def _import_column(values: typing.Sequence[str]) -> typing.List:
+    r"""Convert strings of a CSV column to int, float, bool, and None.
+
+    The result is the same as calling :func:`_import_csv`
+    on every value,
+    but columns holding only int or only float values
+    are converted in bulk,
+    and other columns convert each distinct value only once.
+
+    """
+    try:
+        return list(map(int, values))
+    except ValueError:
+        pass
+    try:
+        floats = list(map(float, values))
+    except ValueError:
+        pass
+    else:
+        # _import_csv() would convert strings like '1' to int
+        if not any(f.is_integer() or not math.isfinite(f) for f in floats):
+            return floats
+    converted = {}
+    column = []
+    for value in values:
+        if value not in converted:
+            converted[value] = _import_csv(value)
+        column.append(converted[value])
+    return column
+
+
+def _import_series(series: 'pd.Series') -> typing.List:
+    r"""Convert column of data frame to list of Python values.
+
+    Missing values are converted to ``None``,
+    NumPy scalars to the corresponding Python type.
+
+    """
+    import numpy as np
+
+    values = series.tolist()
+    if series.dtype == object:
+        values = [
+            value.item() if isinstance(value, np.generic) else value
+            for value in values
+        ]
+    if series.hasnans:
+        missing = series.isna().tolist()
+        values = [
+            None if is_missing else value
+            for value, is_missing in zip(values, missing)
+        ]
+    return values
+
+
+def _is_bool(values: typing.Sequence) -> bool:
+    return isinstance(values, array.array) and values.typecode == 'b'
+
+
+def _list_deltas(url: str) -> typing.List[str]:
+    r"""URLs of delta records of lookup table, oldest first."""
+    path = audfactory.path(url)
+    prefix = f'{path.name}.'
+    return sorted(str(p) for p in path.parent if p.name.startswith(prefix))
+
+
+def _key(params: typing.Dict[str, typing.Any]) -> typing.Tuple:
+    r"""Parameter values sorted by column name.
+
+    Values are compared like in a table row,
+    so the key can be used to look up rows
+    in :meth:`Lookup._params_index`.
+
+    """
+    return tuple(value for _, value in sorted(params.items()))
+
+
+def _download(
+        url: str,
+        *,
+        sha1: str = None,
+        missing_ok: bool = False,
+) -> typing.Tuple[typing.Optional[typing.List[typing.List]], str]:
+    r"""Download lookup table and its SHA1 checksum.
+
+    If ``sha1`` matches the checksum of the table on the server,
+    the table is not parsed
+    and ``None`` is returned instead.
+    If ``missing_ok`` is ``True``
+    and the table does not exist,
+    ``(None, None)`` is returned.
+
+    If ``sha1`` is ``None``
+    and :attr:`audfactory.config.LOOKUP_CACHE_ROOT` is set,
+    the table is revalidated against the persistent cache
+    and only downloaded if it has changed on the server.
+
+    """
+    cached = None
+    if sha1 is None:
+        cached = _cache_load(url)
+        if cached is not None:
+            sha1 = cached[1]
+    headers = None
+    if sha1 is not None:
+        # Artifactory uses the SHA1 checksum as ETag
+        headers = {'If-None-Match': sha1}
+    r = audfactory.rest_api_get(url, headers=headers)
     code = r.status_code
-    if code in [403, 404]:  # pragma: no cover
-        raise RuntimeError(
-            f"{code}, URL not found or no access rights: '{url}'"
-        )
-    elif code != 200:  # pragma: no cover
-        raise RuntimeError(
-            f"{code}, problem downloading '{url}'.\n{audfactory.REPORT_ISSUE}"
-        )
+    if code == 304:
+        if cached is not None:
+            return cached
+        return None, sha1
+    elif code == 404 and missing_ok:
+        return None, None
+    _check_response(r, url)
+    content_sha1 = hashlib.sha1(r.content).hexdigest()
+    if content_sha1 == sha1:  # pragma: no cover
+        # Server does not support conditional requests
+        if cached is not None:
+            return cached
+        return None, sha1
     r.encoding = 'utf-8'
-    table = []
-    csvreader = csv.reader(r.text.splitlines(), delimiter=',')
-    for row in csvreader:
-        # Convert '' to None
-        row = [_import_csv(r) for r in row]
-        table.append(row)
-    return table
+    if _format(url) in ['json', 'log']:
+        table = _parse_json(r.text)
+    else:
+        table = _parse(r.text)
+    _cache_save(url, table, content_sha1)
+    return table, content_sha1
+
+
+def _download_delta(url: str) -> typing.Optional[typing.List]:
+    r"""Download changes of delta record.
+
+    Returns ``None``
+    if the delta record does not exist.
+
+    """
+    r = audfactory.rest_api_get(url)
+    if r.status_code == 404:  # pragma: no cover
+        return None
+    return r.json()
+
+
+def _parse(text: str) -> typing.Union[_Table, typing.List[typing.List]]:
+    r"""Parse CSV file of lookup table.
+
+    The values are converted column by column
+    with :func:`_import_column`
+    and stored as :class:`_Table`.
+    IDs are always strings.
+    Tables with rows of different length,
+    like the index of lookup tables,
+    are returned as list of rows.
+
+    """
+    rows = list(csv.reader(text.splitlines(), delimiter=','))
+    if len(rows) == 0:
+        return []
+    header = [_import_csv(value) for value in rows[0]]
+    if any(len(row) != len(header) for row in rows):
+        return [[_import_csv(value) for value in row] for row in rows]
+    if len(rows) == 1:
+        return _Table.from_rows([header])
+    columns = list(zip(*rows[1:]))
+    return _Table(
+        header,
+        list(columns[0]),
+        [_encode(_import_column(values)) for values in columns[1:]],
+    )
+
+
+def _parse_json(text: str) -> _Table:
+    r"""Parse JSON file of lookup table.
+
+    See :func:`_export_json` for the layout of the file.
+
+    """
+    data = json.loads(text)
+    return _Table.from_columns(data['header'], data['columns'], data['types'])
+
+
+def _search_group(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+        params: typing.Dict[str, typing.Any],
+) -> typing.Tuple[typing.List[typing.Tuple[str, str]], typing.List[str]]:
+    r"""Search entry in index of lookup tables of a group ID.
+
+    Returns versions and IDs of matching entries
+    found in the index,
+    and the versions that have to be searched
+    by downloading their lookup tables
+    if the index does not exist.
+
+    """
+    versions = audfactory.versions(server, repository, group_id, name)
+    if len(versions) == 0:
+        return [], []
+    index, _ = _download(
+        _url_index(server, repository, group_id, name),
+        missing_ok=True,
+    )
+    if index is None:
+        return [], versions
+    key = _key(params)
+    found = {row[0]: row[1] for row in index[1:] if tuple(row[2:]) == key}
+    return [(v, found[v]) for v in versions if v in found], []
 
 
 def _sort(table: typing.List[typing.List]) -> typing.List[typing.List]:
@@ -710,19 +2921,102 @@ def _sort(table: typing.List[typing.List]) -> typing.List[typing.List]:
 def _upload(
         table: typing.List[typing.List],
         url: str,
-) -> None:
-    r"""Upload table to a CSV file on Artifactory without using a tmp file."""
-    fobj = io.StringIO()
-    writer = csv.writer(fobj, delimiter=',')
-    writer.writerows(table)
-    # Seek to beginning of file, otherwise an empty CSV file will be written
-    fobj.seek(0)
+) -> str:
+    r"""Upload table to a CSV or JSON file on Artifactory.
+
+    The format is selected by the extension of ``url``.
+    No tmp file is used.
+    Returns SHA1 checksum of uploaded file.
+
+    """
+    if _format(url) in ['json', 'log']:
+        content = _export_json(table)
+    else:
+        fobj = io.StringIO()
+        writer = csv.writer(fobj, delimiter=',')
+        writer.writerows(table)
+        content = fobj.getvalue().encode('utf-8')
+    sha1 = hashlib.sha1(content).hexdigest()
     artifactory_path = audfactory.path(url)
     if not artifactory_path.parent.exists():
         artifactory_path.parent.mkdir()
-    artifactory_path.deploy(fobj)
+    artifactory_path.deploy(io.BytesIO(content), sha1=sha1)
+    if isinstance(table, _Table):
+        _cache_save(url, table, sha1)
+
+    return sha1
+
+
+def _update_index(
+        url: str,
+        version: str,
+        table: typing.Optional[typing.List[typing.List]],
+):
+    r"""Replace entries of a version in index on server.
+
+    The index stores a row ``[version, id, *values]``
+    for every entry of every lookup table.
+    If ``table`` is ``None``,
+    the version is removed from the index.
+    Nothing is done if the index does not exist.
+
+    Like for lookup tables,
+    the index is checked again after uploading,
+    so concurrent updates of other versions are not lost.
+
+    """
+    rows = []
+    if table is not None:
+        rows = [[version] + row for row in table[1:]]
+    sha1 = None
+    for _ in range(MAX_CONFLICTS):
+        index, sha1 = _download(url, sha1=sha1, missing_ok=True)
+        if index is None:
+            # Index does not exist, or is unchanged since our upload
+            return
+        if [row for row in index[1:] if row[0] == version] == rows:
+            return
+        other_rows = [row for row in index[1:] if row[0] != version]
+        sha1 = _upload([index[0]] + other_rows + rows, url)
+    raise RuntimeError(  # pragma: no cover
+        f"Could not upload '{url}', "
+        f"it was changed by others {MAX_CONFLICTS} times."
+    )
+
 
-    return url
+def _upload_delta(changes: typing.List, url: str) -> str:
+    r"""Upload delta record next to lookup table.
+
+    The name of the delta record starts with the name of the table,
+    followed by the upload time in nanoseconds
+    and a random string,
+    so delta records of concurrent uploads
+    don't overwrite each other,
+    and sorting their names gives the order they were written.
+    Returns URL of delta record.
+
+    """
+    stamp = f'{time.time_ns():020d}-{audeer.uid()[:8]}'
+    delta_url = f'{url}.{stamp}.json'
+    content = json.dumps(changes, separators=(',', ':')).encode('utf-8')
+    sha1 = hashlib.sha1(content).hexdigest()
+    audfactory.path(delta_url).deploy(io.BytesIO(content), sha1=sha1)
+    return delta_url
+
+
+def _url_index(
+        server: str,
+        repository: str,
+        group_id: str,
+        name: str,
+) -> str:
+    url = audfactory.url(
+        server,
+        repository=repository,
+        group_id=group_id,
+        name=name,
+    )
+    return f'{url}/{name}-index.{LOOKUP_EXT}'
 
 
 def _url_table(
@@ -731,6 +3025,7 @@ def _url_table(
         group_id: str,
         name: str,
         version: str,
+        format: str = LOOKUP_EXT,
 ) -> str:
     url = audfactory.url(
         server,
@@ -739,4 +3034,4 @@ def _url_table(
         name=name,
         version=version,
     )
-    return f'{url}/{name}-{version}.{LOOKUP_EXT}'
+    return f'{url}/{name}-{version}.{format}'
@@ -0,0 +1,83 @@
+"""Benchmark parsing of lookup table files.
+
+Compares converting every cell of a CSV file with ``_import_csv()``
+against the column-wise conversion of ``_parse()``,
+and against parsing the typed JSON format with ``_parse_json()``,
+for a table with 1M cells.
+
+Run with:
+
+.. code-block:: bash
+
+    $ python misc/benchmark-lookup-parsing.py
+
+"""
+import csv
+import io
+import random
+import time
+
+import audeer
+
+from audfactory.core.lookup import _export_json
+from audfactory.core.lookup import _import_csv
+from audfactory.core.lookup import _parse
+from audfactory.core.lookup import _parse_json
+
+
+NUM_ROWS = 50_000
+NUM_COLUMNS = 20
+REPETITIONS = 3
+
+
+def create_table(num_rows, num_columns):
+    random.seed(1)
+    header = ['id'] + [f'param-{n:02d}' for n in range(num_columns)]
+    values = [
+        lambda: random.choice([8000, 16000, 22050, 44100, 48000]),
+        lambda: random.random(),
+        lambda: random.choice([True, False]),
+        lambda: random.choice(['emodb', 'voxceleb1', 'voxceleb2', None]),
+        lambda: random.randint(0, 1000),
+    ]
+    table = [header]
+    for _ in range(num_rows):
+        row = [audeer.uid()]
+        for n in range(num_columns):
+            row.append(values[n % len(values)]())
+        table.append(row)
+    fobj = io.StringIO()
+    csv.writer(fobj, delimiter=',').writerows(table)
+    return fobj.getvalue()
+
+
+def parse_per_cell(text):
+    table = []
+    csvreader = csv.reader(text.splitlines(), delimiter=',')
+    for row in csvreader:
+        row = [_import_csv(r) for r in row]
+        table.append(row)
+    return table
+
+
+def benchmark(func, text):
+    durations = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        table = func(text)
+        durations.append(time.perf_counter() - start)
+    return min(durations), table
+
+
+text = create_table(NUM_ROWS, NUM_COLUMNS)
+num_cells = NUM_ROWS * (NUM_COLUMNS + 1)
+t_cell, expected = benchmark(parse_per_cell, text)
+t_column, table = benchmark(_parse, text)
+assert table == expected
+t_json, table = benchmark(_parse_json, _export_json(table).decode())
+assert table == expected
+
+print(f'Table with {num_cells} cells')
+print(f'CSV per cell:  {t_cell:.3f} s')
+print(f'CSV by column: {t_column:.3f} s ({t_cell / t_column:.1f}x)')
+print(f'JSON:          {t_json:.3f} s ({t_cell / t_json:.1f}x)')
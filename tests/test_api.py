@@ -1,6 +1,7 @@
 import os
 
 import pytest
+import requests
 
 import audeer
 
@@ -94,6 +95,55 @@ def test_checksum(tmpdir):
         audfactory.checksum(path, type='sha256')
 
 
+def test_checksum_cache(tmpdir, monkeypatch):
+    path = os.path.join(tmpdir, 'file.txt')
+    with open(path, 'w') as fp:
+        fp.write('hello')
+    expected = {
+        type: audfactory.checksum(path, type=type)
+        for type in ['md5', 'sha1', 'sha256']
+    }
+
+    monkeypatch.setattr(
+        audfactory.config,
+        'CHECKSUM_CACHE_ROOT',
+        str(tmpdir.mkdir('cache')),
+    )
+    monkeypatch.setattr(audfactory.config, 'CHECKSUM_CACHE_SIZE', 2)
+
+    for _ in range(2):
+        for type, checksum in expected.items():
+            assert audfactory.checksum(path, type=type) == checksum
+    # Cache is limited to two entries
+    with audfactory.core.api._checksum_cache() as db:
+        rows = db.execute('SELECT type FROM checksums').fetchall()
+        assert rows == [('sha1',), ('sha256',)]
+    # Changed file is detected
+    with open(path, 'w') as fp:
+        fp.write('hello world')
+    assert audfactory.checksum(path) != expected['md5']
+
+
+@pytest.mark.parametrize('type', ['md5', 'sha1', 'sha256'])
+def test_checksum_many(tmpdir, type):
+    paths = []
+    for n in range(10):
+        path = os.path.join(tmpdir, f'file-{n}.txt')
+        with open(path, 'w') as fp:
+            fp.write(str(n) * 1000)
+        paths.append(path)
+    url = (
+        f'{SERVER}/{REPOSITORY}/{GROUP_ID_URL}/'
+        f'{NAME}/{VERSION}/{FILENAME}.zip'
+    )
+    paths.append(url)
+    expected = [audfactory.checksum(path, type=type) for path in paths]
+    assert audfactory.checksum_many(paths, type=type) == expected
+    assert audfactory.checksum_many([]) == []
+    with pytest.raises(RuntimeError, match=r'File not found:'):
+        audfactory.checksum_many(['file-not-found.txt'])
+
+
 @pytest.mark.parametrize(
     'filename,content,expected_versions',
     [
@@ -160,6 +210,134 @@ def test_deploy(filename, content, expected_versions):
     assert expected_versions == versions
 
 
+@pytest.mark.parametrize('by_checksum', [True, False])
+def test_deploy_by_checksum(tmpdir, monkeypatch, by_checksum):
+    url = audfactory.url(
+        SERVER,
+        group_id=GROUP_ID,
+        repository=REPOSITORY,
+        name=NAME,
+        version=VERSION,
+    )
+    path = os.path.join(tmpdir, 'file.txt')
+    with open(path, 'w') as fp:
+        fp.write(f'hello\n{by_checksum}')
+    # First deployment has to upload the file,
+    # the second can be deployed by checksum
+    urls = [
+        f'{url}/first-{by_checksum}.txt',
+        f'{url}/second-{by_checksum}.txt',
+    ]
+    audfactory.deploy(path, urls[0], by_checksum=by_checksum)
+
+    def fail(*args, **kwargs):
+        raise AssertionError('unexpected request')
+
+    if by_checksum:
+        # File must not be uploaded again
+        monkeypatch.setattr(audfactory.core.api, '_deploy_file', fail)
+    else:
+        monkeypatch.setattr(audfactory.core.api, '_deploy_by_checksum', fail)
+    audfactory.deploy(path, urls[1], by_checksum=by_checksum)
+    monkeypatch.undo()
+
+    for artifact_url in urls:
+        assert audfactory.checksum(artifact_url) == audfactory.checksum(path)
+        audfactory.path(artifact_url).unlink()
+
+
+def test_deploy_retries(tmpdir, monkeypatch):
+    url = audfactory.url(
+        SERVER,
+        group_id=GROUP_ID,
+        repository=REPOSITORY,
+        name=NAME,
+        version=VERSION,
+    )
+    url = f'{url}/retries.txt'
+    path = os.path.join(tmpdir, 'file.txt')
+    with open(path, 'w') as fp:
+        fp.write('retries')
+    deploy = audfactory.core.api.ArtifactoryPath.deploy
+    errors = []
+
+    def failing_deploy(self, fobj, **kwargs):
+        if errors:
+            error = errors.pop(0)
+            if error == 'checksum':
+                # Server rejects upload with wrong checksum
+                kwargs['sha1'] = '0' * 40
+            else:
+                raise error
+        return deploy(self, fobj, **kwargs)
+
+    monkeypatch.setattr(
+        audfactory.core.api.ArtifactoryPath,
+        'deploy',
+        failing_deploy,
+    )
+
+    def deploy_artifact(retries):
+        return audfactory.deploy(
+            path,
+            url,
+            by_checksum=False,
+            retries=retries,
+        )
+
+    with pytest.raises(ValueError, match='0 or larger'):
+        deploy_artifact(-1)
+    # Connection error
+    errors = [requests.exceptions.ConnectionError()]
+    with pytest.raises(requests.exceptions.ConnectionError):
+        deploy_artifact(0)
+    errors = [requests.exceptions.ConnectionError()]
+    assert deploy_artifact(1) == url
+    assert audfactory.checksum(url) == audfactory.checksum(path)
+    audfactory.path(url).unlink()
+    # Checksum mismatch
+    errors = ['checksum']
+    with pytest.raises(RuntimeError, match='does not match'):
+        deploy_artifact(0)
+    assert not audfactory.path(url).exists()
+    errors = ['checksum', 'checksum']
+    assert deploy_artifact(2) == url
+    assert audfactory.checksum(url) == audfactory.checksum(path)
+    audfactory.path(url).unlink()
+    # Other errors are not repeated
+    response = requests.Response()
+    response.status_code = 500
+    errors = [requests.exceptions.HTTPError(response=response)]
+    with pytest.raises(requests.exceptions.HTTPError):
+        deploy_artifact(1)
+    assert errors == []
+
+
+@pytest.mark.parametrize(
+    'config_entry,expected',
+    [
+        (None, (True, None)),
+        ({'verify': False, 'cert': None}, (False, None)),
+        ({'verify': '/ca.pem', 'cert': '/cert.pem'}, ('/ca.pem', '/cert.pem')),
+    ],
+)
+def test_tls_settings(monkeypatch, config_entry, expected):
+    url = f'{SERVER}/{REPOSITORY}'
+    monkeypatch.setattr(
+        audfactory.core.api,
+        'get_global_config_entry',
+        lambda url: config_entry,
+    )
+    verify, cert = expected
+    path = audfactory.path(url)
+    assert path.verify == verify
+    assert path.session.verify == verify
+    assert path.session.cert == cert
+    username, apikey = audfactory.authentification(url)
+    session = audfactory.core.api._session(username, apikey, verify, cert)
+    assert session is path.session
+
+
 @pytest.mark.parametrize(
     'url,destination,force_download,expected_path',
     [
@@ -242,6 +420,26 @@ def test_download(
     assert os.path.basename(path) == expected_path
 
 
+def test_download_lock(tmpdir):
+    url = (
+        f'{SERVER}/{REPOSITORY}/{GROUP_ID_URL}/'
+        f'{NAME}/{VERSION}/{FILENAME}.zip'
+    )
+    destination = str(tmpdir)
+    # Download the same artifact concurrently
+    params = [([url, destination], {'lock': True}) for _ in range(8)]
+    paths = audeer.run_tasks(audfactory.download, params, num_workers=8)
+    expected_path = os.path.join(destination, f'{FILENAME}.zip')
+    assert paths == [expected_path] * 8
+    assert audfactory.checksum(expected_path) == audfactory.checksum(url)
+    # No temporary or lock files are left behind
+    assert os.listdir(destination) == [f'{FILENAME}.zip']
+    # Lock is acquired again after its file was removed
+    path = audfactory.download(url, destination, lock=True)
+    assert path == expected_path
+    assert os.listdir(destination) == [f'{FILENAME}.zip']
+
+
 @pytest.mark.parametrize(
     'group_id,expected_path',
     [
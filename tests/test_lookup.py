@@ -1,5 +1,6 @@
 import csv
 import os
+import pickle
 
 import pandas as pd
 import pytest
@@ -52,6 +53,103 @@ def test_init(group_id, version):
     audfactory.Lookup(SERVER, REPOSITORY, group_id, version=version)
 
 
+def test_init_lazy(lookup_table):
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=VERSION,
+        lazy=True,
+    )
+    assert lookup.table == [['id']]
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version='0.0.0',
+        lazy=True,
+    )
+    with pytest.raises(RuntimeError):
+        lookup.table
+
+
+def test_batch(lookup_table):
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=VERSION)
+    with lookup_table.batch():
+        lookup_table.extend(('a', 'b'))
+        uid1 = lookup_table.append({'a': 1, 'b': 2})
+        assert lookup_table[uid1] == {'a': 1, 'b': 2}
+        with lookup_table.batch():
+            uid2 = lookup_table.append({'a': 3, 'b': 4})
+        assert lookup_table[uid2] == {'a': 3, 'b': 4}
+        lookup_table.remove({'a': 1, 'b': 2})
+        uid3 = lookup_table.append_many([{'a': 5, 'b': 6}])[0]
+        assert lookup_table.ids == [uid2, uid3]
+        assert lookup_table.find({'a': 5, 'b': 6}) == uid3
+        # Nothing is uploaded inside the batch
+        assert lookup.table == [['id']]
+    assert lookup.ids == [uid2, uid3]
+    assert lookup_table[uid1] == {}
+    # No upload on error
+    with pytest.raises(RuntimeError):
+        with lookup_table.batch():
+            lookup_table.clear()
+            lookup_table.append({'a': 1, 'b': 2})
+            lookup_table.append({'a': 1, 'b': 2})
+    assert lookup_table.ids == [uid2, uid3]
+    assert lookup.ids == [uid2, uid3]
+    with pytest.raises(RuntimeError):
+        with lookup_table.batch():
+            lookup_table.remove({'a': 3, 'b': 4})
+            lookup_table.append({'a': 7, 'b': 8})
+            lookup_table.append({'a': 5, 'b': 6})
+    assert lookup_table.ids == [uid2, uid3]
+    assert lookup_table.find({'a': 3, 'b': 4}) == uid2
+    # Uncommitted changes cannot be copied
+    with pytest.raises(RuntimeError, match='inside a batch'):
+        with lookup_table.batch():
+            lookup_table.remove({'a': 3, 'b': 4})
+            lookup_table.copy_to('2.0.0')
+    assert lookup_table.ids == [uid2, uid3]
+    assert not audfactory.Lookup.exists(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        '2.0.0',
+    )
+    # No upload without changes
+    with lookup_table.batch():
+        assert lookup_table.contains({'a': 5, 'b': 6})
+
+
+def test_cache(lookup_table):
+    params = {'a': 1, 'b': None, 'c': True}
+    lookup_table.extend(params)
+    # Lookup objects without and with max_age
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=VERSION)
+    cached_lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=VERSION,
+        max_age=3600,
+    )
+    assert lookup.table == cached_lookup.table == lookup_table.table
+    # Returned table is a copy of the cached table
+    table = lookup.table
+    table.append(['0', 0, 'b', False])
+    assert lookup.table == lookup_table.table
+    # Changes on the server are detected
+    # if max_age is exceeded
+    uid = lookup_table.find(params)
+    lookup_table.append({'a': 2, 'b': 'b', 'c': False})
+    assert lookup.table == lookup_table.table
+    assert cached_lookup.table != lookup_table.table
+    assert cached_lookup.ids == [uid]
+    cached_lookup.max_age = 0
+    assert cached_lookup.table == lookup_table.table
+
+
 def test_getitem(lookup_table):
     params = {'a': 1, 'b': 2, 'c': 3}
     lookup_table.extend(list(params.keys()))
@@ -59,6 +157,21 @@ def test_getitem(lookup_table):
     table = lookup_table.table
     uid = table[1][0]
     assert params == lookup_table[uid]
+    assert lookup_table['non-existing'] == {}
+
+
+def test_get_many(lookup_table):
+    lookup_table.extend(('a', 'b'))
+    uid1 = lookup_table.append({'a': 1, 'b': 2})
+    uid2 = lookup_table.append({'a': 3, 'b': 4})
+    assert lookup_table.get_many([]) == []
+    assert lookup_table.get_many([uid2, 'non-existing', uid1]) == [
+        {'a': 3, 'b': 4},
+        {},
+        {'a': 1, 'b': 2},
+    ]
+    lookup_table.remove({'a': 1, 'b': 2})
+    assert lookup_table.get_many([uid1, uid2]) == [{}, {'a': 3, 'b': 4}]
 
 
 def test_str(lookup_table):
@@ -74,6 +187,77 @@ def test_str(lookup_table):
     )
     assert str(lookup_table) == expected_message
     assert repr(lookup_table) == expected_message
+    # Long tables are truncated
+    lookup_table.clear()
+    uids = lookup_table.append_many([{**params, 'f': n} for n in range(25)])
+    lines = repr(lookup_table).split('\n')
+    assert len(lines) == 22
+    assert lines[0].endswith('f ')
+    assert lines[1] == f'{uids[0]}  1  2.0  3.0.0  True  4.0  0 '
+    assert lines[10].startswith(uids[9])
+    assert lines[11] == '...'
+    assert lines[12].startswith(uids[15])
+    assert lines[-1] == f'{uids[-1]}  1  2.0  3.0.0  True  4.0  24'
+
+
+def test_concurrent_changes(lookup_table):
+    lookup_table.extend(('a', 'b'))
+    # Second lookup object,
+    # which does not notice changes by the first one
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=VERSION,
+        max_age=3600,
+    )
+    assert lookup.ids == []
+    uid1 = lookup_table.append({'a': 1, 'b': 2})
+    uid2 = lookup.append({'a': 3, 'b': 4})
+    assert lookup.ids == [uid1, uid2]
+    with lookup.batch():
+        lookup.remove({'a': 1, 'b': 2})
+        uid3 = lookup.append({'a': 5, 'b': 6})
+        uid4 = lookup_table.append({'a': 7, 'b': 8})
+    assert lookup.table == lookup_table.table == [
+        ['id', 'a', 'b'],
+        [uid2, 3, 4],
+        [uid4, 7, 8],
+        [uid3, 5, 6],
+    ]
+    # Changes that conflict with the new table fail
+    lookup_table.extend({'c': None})
+    with pytest.raises(RuntimeError):
+        lookup.append({'a': 9, 'b': 10})
+    assert lookup.table == lookup_table.table
+    # Remove entry that was already removed by others
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=VERSION,
+        max_age=3600,
+    )
+    assert lookup.ids == [uid2, uid4, uid3]
+    lookup_table.remove({'a': 3, 'b': 4, 'c': None})
+    assert lookup.remove({'a': 3, 'b': 4, 'c': None}) == uid2
+    assert lookup.table == lookup_table.table
+    # Equal entry with different ID was appended by others
+    lookup_table.append({'a': 1, 'b': 2, 'c': None})
+    with pytest.raises(RuntimeError):
+        lookup.append({'a': 1.0, 'b': 2.0, 'c': None})
+    assert lookup.table == lookup_table.table
+    # Extend empty table while others append
+    lookup_table.clear()
+    lookup.max_age = 0
+    assert lookup.ids == []
+    lookup.max_age = 3600
+    uid = lookup_table.append({'a': 1, 'b': 2, 'c': None})
+    lookup.extend({'d': 7})
+    assert lookup.table == lookup_table.table == [
+        ['id', 'a', 'b', 'c', 'd'],
+        [uid, 1, 2, None, 7],
+    ]
 
 
 def test_columns_ids_table(lookup_table):
@@ -130,6 +314,32 @@ def test_append(lookup_table):
         lookup_table.append({'a': len})
 
 
+def test_append_many(lookup_table):
+    assert lookup_table.append_many([]) == []
+    lookup_table.extend(('a', 'b'))
+    params = [{'a': n, 'b': f'b{n}'} for n in range(5)]
+    uids = lookup_table.append_many(params)
+    assert lookup_table.ids == uids
+    assert [lookup_table[uid] for uid in uids] == params
+    # Same IDs as if appended one by one
+    lookup_table.clear()
+    assert [lookup_table.append(p) for p in params] == uids
+    lookup_table.clear()
+    # Fail for duplicated or existing entries
+    with pytest.raises(RuntimeError):
+        lookup_table.append_many([params[0], params[0]])
+    lookup_table.append(params[0])
+    with pytest.raises(RuntimeError):
+        lookup_table.append_many(params)
+    # Fail for wrong columns or data types
+    with pytest.raises(RuntimeError):
+        lookup_table.append_many([params[1], {'a': 1}])
+    with pytest.raises(ValueError):
+        lookup_table.append_many([params[1], {'a': len, 'b': 'x'}])
+    # Nothing is added if one of the entries fails
+    assert lookup_table.ids == uids[:1]
+
+
 def test_contains(lookup_table):
     p1 = {'a': 1}
     p2 = {'b': 2.0}
@@ -140,6 +350,7 @@ def test_contains(lookup_table):
     assert not lookup_table.contains(p1)
     assert not lookup_table.contains(p2)
     assert lookup_table.contains({**p1, **p2})
+    assert not lookup_table.contains({'a': [1], 'b': 2.0})
 
 
 def test_extend(lookup_table):
@@ -179,6 +390,25 @@ def test_find(lookup_table):
     assert lookup_table.find(p) == lookup_table.table[1][0]
 
 
+def test_query(lookup_table):
+    lookup_table.extend(('a', 'b', 'c'))
+    uid1 = lookup_table.append({'a': 1, 'b': 'x', 'c': None})
+    uid2 = lookup_table.append({'a': 1, 'b': 'y', 'c': True})
+    uid3 = lookup_table.append({'a': 2, 'b': 'x', 'c': None})
+    assert lookup_table.query({}) == [uid1, uid2, uid3]
+    assert lookup_table.query({'a': 1}) == [uid1, uid2]
+    assert lookup_table.query({'b': 'x'}) == [uid1, uid3]
+    assert lookup_table.query({'a': 1, 'b': 'x'}) == [uid1]
+    assert lookup_table.query({'a': 2, 'c': None}) == [uid3]
+    assert lookup_table.query({'a': 3}) == []
+    assert lookup_table.query({'a': [1]}) == []
+    # Indices are updated when table changes
+    lookup_table.remove({'a': 1, 'b': 'x', 'c': None})
+    assert lookup_table.query({'a': 1}) == [uid2]
+    with pytest.raises(RuntimeError):
+        lookup_table.query({'d': 1})
+
+
 def test_remove(lookup_table):
     p = {'a': 1}
     with pytest.raises(RuntimeError):
@@ -260,6 +490,18 @@ def test_delete(lookup_table, empty, force):
     )
 
 
+@pytest.mark.parametrize('force', [False, True])
+def test_delete_non_existing(force):
+    with pytest.raises(RuntimeError):
+        audfactory.Lookup.delete(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            '0.0.0',
+            force=force,
+        )
+
+
 def test_exists(lookup_table):
     assert audfactory.Lookup.exists(SERVER, REPOSITORY, GROUP_ID, VERSION)
     assert not audfactory.Lookup.exists(
@@ -270,6 +512,66 @@ def test_exists(lookup_table):
     )
 
 
+def test_index(lookup_table):
+    p = {'a': 1}
+    lookup_table.extend(p)
+    audfactory.Lookup.create(SERVER, REPOSITORY, GROUP_ID, '2.0.0', ['a'])
+    url = audfactory.Lookup.create_index(SERVER, REPOSITORY, GROUP_ID)
+    assert audfactory.path(url).exists()
+
+    def versions(params):
+        return audfactory.Lookup.versions(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            params=params,
+        )
+
+    def latest_version(params):
+        return audfactory.Lookup.latest_version(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            params=params,
+        )
+
+    assert versions(p) == [VERSION]
+    assert latest_version(p) == VERSION
+    assert versions({'a': 2}) == []
+    assert latest_version({'a': 2}) is None
+    # Index is updated when lookup tables change
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version='2.0.0')
+    lookup.append(p)
+    lookup.append({'a': 2})
+    assert versions(p) == [VERSION, '2.0.0']
+    assert latest_version({'a': 2}) == '2.0.0'
+    lookup_table.remove(p)
+    assert versions(p) == ['2.0.0']
+    lookup.clear()
+    assert versions(p) == []
+    lookup_table.append(p)
+    audfactory.Lookup.create(SERVER, REPOSITORY, GROUP_ID, '3.0.0', ['a'])
+    audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID).append(p)
+    assert versions(p) == [VERSION, '3.0.0']
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, '3.0.0')
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, '2.0.0')
+    assert versions(p) == [VERSION]
+    # Recreate index,
+    # ignoring version folders without lookup table
+    url_version = audfactory.url(
+        SERVER,
+        repository=REPOSITORY,
+        group_id=GROUP_ID,
+        name='lookup',
+        version='4.0.0',
+    )
+    audfactory.path(url_version).mkdir()
+    audfactory.Lookup.create_index(SERVER, REPOSITORY, GROUP_ID)
+    assert versions(p) == [VERSION]
+    audfactory.path(url_version).rmdir()
+    audfactory.path(url).unlink()
+
+
 def test_latest_version(lookup_table):
     p = {'a': 1}
     version = audfactory.Lookup.latest_version(
@@ -300,6 +602,23 @@ def test_latest_version(lookup_table):
         params={'a': 0},
     )
     assert version is None
+    # Add newer version without entry
+    audfactory.Lookup.create(SERVER, REPOSITORY, GROUP_ID, '2.0.0', ['a'])
+    version = audfactory.Lookup.latest_version(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+    )
+    assert version == '2.0.0'
+    version = audfactory.Lookup.latest_version(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        params=p,
+        num_workers=1,
+    )
+    assert version == VERSION
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, '2.0.0')
 
 
 def test_versions(lookup_table):
@@ -348,6 +667,13 @@ def test_versions(lookup_table):
     )
     assert versions == [VERSION]
     audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, '2.0.0')
+    versions = audfactory.Lookup.versions(
+        SERVER,
+        REPOSITORY,
+        f'{GROUP_ID}.non-existing',
+        params=p,
+    )
+    assert versions == []
 
 
 @pytest.mark.parametrize(
@@ -403,3 +729,765 @@ def test__check_params_type():
         audfactory.core.lookup._check_params_type({'a': 'None'})
     error = str(error.value)
     assert error == "'None' is forbidden, use the NoneType None instead"
+
+
+def test__table():
+    rows = [
+        ['id', 'a', 'b', 'c', 'd', 'e'],
+        ['0', 1, 1.0, True, 'x', 2 ** 70],
+        ['1', 2, 2.0, False, None, 3],
+    ]
+    table = audfactory.core.lookup._Table.from_rows(rows)
+    assert table == rows
+    assert list(table) == rows
+    assert repr(table) == repr(rows)
+    assert len(table) == 3
+    assert table[0] == rows[0]
+    assert table[1:] == rows[1:]
+    assert table[-1] == rows[-1]
+    assert repr(table[-1]) == repr(rows[-1])
+    assert table[1][2:4] == [1.0, True]
+    assert table[1][-1] == 2 ** 70
+    assert table[2][3] is False
+    with pytest.raises(IndexError):
+        table[3]
+    with pytest.raises(TypeError):
+        hash(table)
+    assert list(table.keys()) == [tuple(row[1:]) for row in rows[1:]]
+    assert table.take([1]) == [rows[0], rows[2]]
+    row = ['2', 3, 3.0, True, 'y', 4]
+    # Change copy in place
+    copy = table.copy()
+    copy.extend([row])
+    assert copy == rows + [row]
+    assert copy.types() == table.types()
+    assert table == rows
+    copy.remove([0, 2])
+    assert copy == [rows[0], rows[2]]
+    assert copy.types() == table.types()
+    # Columns are converted to lists
+    # if new values have a different type
+    row = ['3', True, 3, 1.0, 'z', 2 ** 70]
+    copy.extend([row])
+    assert copy == [rows[0], rows[2], row]
+    assert copy.types() == ['object'] * 5
+    assert copy[2][3] == 1.0
+    # Remove many rows
+    rows = [['id', 'a']] + [[str(n), n] for n in range(200)]
+    copy = audfactory.core.lookup._Table.from_rows(rows).copy()
+    copy.remove(list(range(1, 200)))
+    assert copy == rows[:2]
+    assert copy.types() == ['int']
+    # int too large for 64 bit
+    copy.extend([['1', 1], ['2', 2 ** 70]])
+    assert copy == rows[:3] + [['2', 2 ** 70]]
+    assert copy.types() == ['object']
+    # Empty columns are encoded again
+    copy = audfactory.core.lookup._Table.from_rows(rows[:1]).copy()
+    copy.extend(rows[1:])
+    assert copy == rows
+    assert copy.types() == ['int']
+    # Table without parameters
+    table = audfactory.core.lookup._Table.from_rows([['id'], ['0']])
+    assert list(table.keys()) == [()]
+
+
+def test__apply_delta():
+    rows = [['id', 'a'], ['0', 0], ['1', 1]]
+    table = audfactory.core.lookup._Table.from_rows(rows)
+    changes = [
+        ['append', ['a'], [['1', 1], ['2', 2], ['3', 3]]],
+        ['remove', ['0', '2', '4']],
+        ['append', ['a'], [['0', 0], ['3', 3]]],
+    ]
+    new_table = audfactory.core.lookup._apply_delta(table, changes)
+    assert new_table == [['id', 'a'], ['1', 1], ['3', 3], ['0', 0]]
+    assert table == rows
+    # Nothing to change
+    changes = [['append', ['a'], [['1', 1]]], ['remove', ['2']]]
+    assert audfactory.core.lookup._apply_delta(table, changes) is table
+    # Columns extended after delta record was written
+    rows = [['id', 'a', 'b'], ['0', 0, 0]]
+    table = audfactory.core.lookup._Table.from_rows(rows)
+    changes = [['append', ['a'], [['1', 1]]]]
+    assert audfactory.core.lookup._apply_delta(table, changes) == [
+        ['id', 'a', 'b'],
+        ['0', 0, 0],
+        ['1', 1, None],
+    ]
+
+
+@pytest.mark.parametrize(
+    'text,expected_table',
+    [
+        ('', []),
+        ('id,a\n', [['id', 'a']]),
+        (
+            'id,a,b,c,d,e,f\n'
+            '0,1,0.5,True,x,,1.0\n'
+            '1,2,1.5,False,y,2,2.5\n',
+            [
+                ['id', 'a', 'b', 'c', 'd', 'e', 'f'],
+                ['0', 1, 0.5, True, 'x', None, 1.0],
+                ['1', 2, 1.5, False, 'y', 2, 2.5],
+            ],
+        ),
+        # Rows of different length
+        (
+            'version,id\n'
+            '1.0.0,0,1\n',
+            [['version', 'id'], ['1.0.0', 0, 1]],
+        ),
+    ],
+)
+def test__parse(text, expected_table):
+    table = audfactory.core.lookup._parse(text)
+    assert table == expected_table
+    for row, expected_row in zip(table, expected_table):
+        assert [type(v) for v in row] == [type(v) for v in expected_row]
+
+
+def test_format():
+    version = '2.0.0'
+    params = {'a': 1, 'b': 1.0, 'c': True, 'd': None, 'e': 'x'}
+    with pytest.raises(ValueError):
+        audfactory.Lookup.create(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version,
+            format='yaml',
+        )
+    url = audfactory.Lookup.create(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        list(params),
+        format='json',
+    )
+    assert url.endswith('.json')
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert lookup.format == 'json'
+    assert lookup.url == url
+    uid = lookup.append(params)
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID)
+    assert lookup.format == 'json'
+    assert lookup[uid] == params
+    assert [type(v) for v in lookup.table[1]] == [
+        str, int, float, bool, type(None), str,
+    ]
+    assert audfactory.Lookup.versions(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        params=params,
+    ) == [version]
+    index_url = audfactory.Lookup.create_index(SERVER, REPOSITORY, GROUP_ID)
+    audfactory.path(index_url).unlink()
+    # Convert to CSV and back
+    table = lookup.table
+    for format in ['csv', 'json', 'json']:
+        url = audfactory.Lookup.convert(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version,
+            format,
+        )
+        lookup = audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+            format=format,
+        )
+        assert lookup.url == url
+        assert lookup.format == format
+        assert lookup.table == table
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=version,
+        format='json',
+        lazy=True,
+    )
+    assert lookup.table == table
+    # Overwrite table in other format
+    audfactory.Lookup.create(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        list(params),
+        force=True,
+    )
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert lookup.format == 'csv'
+    assert lookup.table == [table[0]]
+    with pytest.raises(ValueError):
+        audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+            format='yaml',
+        )
+    with pytest.raises(RuntimeError):
+        audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+            format='json',
+        )
+    audfactory.Lookup.delete(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        force=False,
+    )
+
+
+def test_format_log():
+    version = '2.0.0'
+
+    def deltas():
+        url = audfactory.url(
+            SERVER,
+            repository=REPOSITORY,
+            group_id=GROUP_ID,
+            name='lookup',
+            version=version,
+        )
+        return [
+            p.name for p in audfactory.path(url)
+            if p.name.startswith(f'lookup-{version}.log.')
+        ]
+
+    audfactory.Lookup.create(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        ['a'],
+        format='log',
+    )
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert lookup.format == 'log'
+    uid1 = lookup.append({'a': 1})
+    uid2 = lookup.append({'a': 2})
+    with lookup.batch():
+        lookup.remove({'a': 1})
+        uid1 = lookup.append({'a': 1})
+    uid3 = lookup.append({'a': 3})
+    # Only delta records are uploaded
+    assert len(deltas()) == 4
+    table = [['id', 'a'], [uid2, 2], [uid1, 1], [uid3, 3]]
+    assert lookup.table == table
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert other.table == table
+    lookup.remove({'a': 3})
+    assert other.table == table[:-1]
+    assert audfactory.Lookup.versions(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        params={'a': 2},
+    ) == [version]
+    index_url = audfactory.Lookup.create_index(SERVER, REPOSITORY, GROUP_ID)
+    audfactory.path(index_url).unlink()
+    # Merge delta records
+    lookup.compact()
+    assert deltas() == []
+    assert lookup.table == table[:-1]
+    assert other.table == table[:-1]
+    lookup.compact()
+    # Delta records written before extending the table
+    uid4 = other.append({'a': 4})
+    other.max_age = 3600
+    lookup.extend({'b': 0})
+    assert lookup.table == [
+        ['id', 'a', 'b'],
+        [uid2, 2, 0],
+        [uid1, 1, 0],
+        [uid4, 4, 0],
+    ]
+    assert deltas() == []
+    # Changes of outdated lookup table are checked against new table
+    with pytest.raises(RuntimeError, match='do not match'):
+        other.append({'a': 5})
+    assert deltas() == []
+    uid5 = other.append({'a': 5, 'b': 0})
+    other.max_age = 0
+    lookup.remove({'a': 1, 'b': 0})
+    assert lookup.table == other.table == [
+        ['id', 'a', 'b'],
+        [uid2, 2, 0],
+        [uid4, 4, 0],
+        [uid5, 5, 0],
+    ]
+    with pytest.raises(RuntimeError):
+        audfactory.Lookup.delete(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version,
+            force=False,
+        )
+    # Convert to CSV
+    table = other.table
+    audfactory.Lookup.convert(SERVER, REPOSITORY, GROUP_ID, version, 'csv')
+    assert deltas() == []
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert lookup.format == 'csv'
+    assert lookup.table == table
+    lookup.compact()
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, version)
+
+
+def test_format_log_conflicts():
+    version = '2.1.0'
+    audfactory.Lookup.create(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        ['a', 'b'],
+        format='log',
+    )
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version=version,
+        max_age=3600,
+    )
+    uid1 = lookup.append({'a': 1, 'b': 0})
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    other.extend('c')
+    uid2 = other.append({'a': 1, 'b': 1, 'c': None})
+    # Replay after conflict fails,
+    # but delta records applied to the new table are kept
+    with pytest.raises(RuntimeError, match='no longer be unique'):
+        lookup.drop_columns('b')
+    assert lookup.ids == [uid1, uid2]
+    assert lookup.columns == ['a', 'b', 'c']
+    # Delta records written after the table was loaded
+    # are applied before the table is replaced
+    uid3 = other.append({'a': 2, 'b': 0, 'c': None})
+    with pytest.raises(RuntimeError, match='no longer be unique'):
+        lookup.drop_columns('a')
+    assert lookup.ids == [uid1, uid2, uid3]
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert other.columns == ['a', 'b', 'c']
+    uid4 = other.append({'a': 3, 'b': 0, 'c': None})
+    lookup.extend({'d': 0})
+    expected = {'a': 3, 'b': 0, 'c': None, 'd': 0}
+    assert lookup[uid4] == expected
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert other[uid4] == expected
+    assert len(other.ids) == 4
+    # Entry was already removed by others
+    other.remove_many([uid4])
+    other.compact()
+    assert lookup.remove_many([uid4]) == [uid4]
+    assert lookup.ids == other.ids == [uid1, uid2, uid3]
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, version)
+
+
+def test_persistent_cache(tmpdir, monkeypatch):
+    version = '3.0.0'
+    cache_root = str(tmpdir.mkdir('cache'))
+    monkeypatch.setattr(audfactory.config, 'LOOKUP_CACHE_ROOT', cache_root)
+
+    audfactory.Lookup.create(SERVER, REPOSITORY, GROUP_ID, version, ['a'])
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    uid = lookup.append({'a': 1})
+    table = lookup.table
+
+    # Uploaded table is cached and not parsed again
+    with monkeypatch.context() as m:
+        m.setattr(audfactory.core.lookup, '_parse', None)
+        lookup = audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+        )
+        assert lookup.table == table
+        assert lookup[uid] == {'a': 1}
+
+    # Changes by others are detected
+    with monkeypatch.context() as m:
+        m.setattr(audfactory.config, 'LOOKUP_CACHE_ROOT', None)
+        other = audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+        )
+        uid2 = other.append({'a': 2})
+    lookup = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=version)
+    assert lookup.ids == [uid, uid2]
+
+    # Index with rows of different length is cached as well
+    index_url = audfactory.Lookup.create_index(SERVER, REPOSITORY, GROUP_ID)
+    versions = audfactory.Lookup.versions(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        params={'a': 1},
+    )
+    assert version in versions
+    with monkeypatch.context() as m:
+        m.setattr(audfactory.core.lookup, '_parse', None)
+        assert audfactory.Lookup.versions(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            params={'a': 1},
+        ) == versions
+    audfactory.path(index_url).unlink()
+
+    # Broken entries are ignored and replaced,
+    # entries are not unpickled
+    entries = [
+        b'broken',
+        b'{}\n[]',
+        pickle.dumps({'sha1': None, 'table': table}),
+    ]
+    for entry in entries:
+        for path in audeer.list_file_names(cache_root):
+            with open(path, 'wb') as fp:
+                fp.write(entry)
+        lookup = audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+        )
+        assert lookup.ids == [uid, uid2]
+    with monkeypatch.context() as m:
+        m.setattr(audfactory.core.lookup, '_parse', None)
+        lookup = audfactory.Lookup(
+            SERVER,
+            REPOSITORY,
+            GROUP_ID,
+            version=version,
+        )
+        assert lookup.ids == [uid, uid2]
+
+    lookup.clear()
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, version)
+
+
+def test_dataframe(lookup_table):
+    version = '4.0.0'
+    # Lookup table without columns
+    uid = lookup_table.append_dataframe(pd.DataFrame(index=[0]))[0]
+    assert lookup_table.ids == [uid]
+    lookup_table.clear()
+
+    df = pd.DataFrame(
+        {
+            'b': [1.5, None, 2.0],
+            'a': [1, 2, 3],
+            'c': ['x', None, 'y'],
+            'd': [True, False, True],
+            'e': [1, 'z', None],
+        },
+        index=['i', 'j', 'k'],
+    )
+    lookup = audfactory.Lookup.from_dataframe(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        df,
+        format='json',
+    )
+    assert lookup.format == 'json'
+    assert lookup.columns == ['a', 'b', 'c', 'd', 'e']
+    # IDs match the ones of append_many()
+    expected = [
+        {'a': 1, 'b': 1.5, 'c': 'x', 'd': True, 'e': 1},
+        {'a': 2, 'b': None, 'c': None, 'd': False, 'e': 'z'},
+        {'a': 3, 'b': 2.0, 'c': 'y', 'd': True, 'e': None},
+    ]
+    assert lookup.get_many(lookup.ids) == expected
+    lookup_table.extend(['a', 'b', 'c', 'd', 'e'])
+    assert lookup_table.append_many(expected) != lookup.ids
+    lookup_table.clear()
+    lookup_table.version = version
+    assert lookup_table.append_many(expected) == lookup.ids
+    lookup_table.version = VERSION
+
+    result = lookup.to_dataframe()
+    assert list(result.index) == lookup.ids
+    assert result.index.name == 'id'
+    assert list(result.columns) == lookup.columns
+    assert result['a'].dtype == 'int64'
+    assert result['d'].dtype == 'bool'
+    for column in ['b', 'c', 'e']:
+        assert result[column].dtype == object
+    assert result.to_dict('records') == expected
+    # Round trip
+    table = lookup.table
+    other = audfactory.Lookup.from_dataframe(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version,
+        result,
+        force=True,
+    )
+    assert other.format == 'csv'
+    assert other.table == table
+    assert other.to_dataframe().equals(result)
+
+    # Errors
+    with pytest.raises(RuntimeError, match='already exists'):
+        other.append_dataframe(df)
+    with pytest.raises(RuntimeError, match='already exists'):
+        other.append_dataframe(
+            pd.DataFrame({'a': [4, 4], 'b': 1, 'c': 'x', 'd': True, 'e': 0})
+        )
+    with pytest.raises(RuntimeError, match='do not match'):
+        other.append_dataframe(df[['a', 'b']])
+    with pytest.raises(ValueError, match='forbidden'):
+        other.append_dataframe(
+            pd.DataFrame({'a': 4, 'b': 1, 'c': ['4'], 'd': True, 'e': 0})
+        )
+    with pytest.raises(ValueError, match='only contain values'):
+        other.append_dataframe(
+            pd.DataFrame({'a': 4, 'b': 1, 'c': [[1]], 'd': True, 'e': 0})
+        )
+    assert other.table == table
+    # NumPy values in object columns are converted
+    df = pd.DataFrame({'a': 4, 'b': 1, 'c': 'x', 'd': True, 'e': [0]})
+    df['e'] = df['e'].astype(object)
+    df.loc[0, 'e'] = df['a'].to_numpy()[0]
+    uid = other.append_dataframe(df)[0]
+    assert type(other[uid]['e']) is int
+    # Empty lookup table
+    other.clear()
+    assert other.to_dataframe().empty
+    assert list(other.to_dataframe().columns) == other.columns
+
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, version)
+
+
+def test_iter_rows(lookup_table):
+    lookup_table.extend(['a', 'b', 'c'])
+    lookup_table.append_many(
+        [{'a': n, 'b': n / 2, 'c': f'x{n % 3}'} for n in range(10)]
+    )
+    lookup_table.append({'a': None, 'b': True, 'c': 'y'})
+    table = lookup_table.table
+    assert list(lookup_table.iter_rows()) == table
+    # Streamed rows don't replace the cached table
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=VERSION)
+    uid = other.append({'a': 10, 'b': 5.0, 'c': 'x1'})
+    lookup_table.max_age = 3600
+    assert list(lookup_table.iter_rows()) == table
+    lookup_table.max_age = 0
+    rows = list(lookup_table.iter_rows())
+    assert rows == table + [[uid, 10, 5.0, 'x1']]
+    assert [type(value) for value in rows[-2]] == [str, type(None), bool, str]
+    assert lookup_table._table == table
+    assert lookup_table.table == rows
+    # Rows of cached table
+    with lookup_table.batch():
+        assert list(lookup_table.iter_rows()) == rows
+    # Missing lookup table
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        GROUP_ID,
+        version='0.0.0',
+        lazy=True,
+    )
+    with pytest.raises(RuntimeError, match='404'):
+        next(lookup.iter_rows())
+
+
+def test_remove_many(lookup_table):
+    lookup_table.extend(['a', 'b'])
+    uids = lookup_table.append_many([{'a': n, 'b': 0} for n in range(6)])
+    with pytest.raises(RuntimeError, match='Could not find'):
+        lookup_table.remove_many([uids[0], 'non-existing'])
+    with pytest.raises(RuntimeError, match='Could not find'):
+        lookup_table.remove_many([uids[0], {'a': 6, 'b': 0}])
+    assert lookup_table.ids == uids
+    removed = lookup_table.remove_many([uids[1], {'a': 3, 'b': 0}, uids[4]])
+    assert removed == [uids[1], uids[3], uids[4]]
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=VERSION)
+    assert other.ids == [uids[0], uids[2], uids[5]]
+    assert lookup_table.remove_many([]) == []
+
+
+def test_drop_columns(lookup_table):
+    lookup_table.extend(['a', 'b', 'c'])
+    uid1 = lookup_table.append({'a': 1, 'b': 1.5, 'c': 'x'})
+    uid2 = lookup_table.append({'a': 2, 'b': 1.5, 'c': 'x'})
+    lookup_table.drop_columns(['c', 'd'])
+    expected = [['id', 'a', 'b'], [uid1, 1, 1.5], [uid2, 2, 1.5]]
+    assert lookup_table.table == expected
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version=VERSION)
+    assert other.table == expected
+    # Nothing to drop
+    lookup_table.drop_columns('c')
+    assert lookup_table.table == expected
+    # Entries must stay unique
+    with pytest.raises(RuntimeError, match='no longer be unique'):
+        lookup_table.drop_columns('a')
+    assert other.table == expected
+    lookup_table.drop_columns('b')
+    assert lookup_table.table == [['id', 'a'], [uid1, 1], [uid2, 2]]
+    assert lookup_table.find({'a': 2}) == uid2
+    # Changes of others are considered
+    lookup_table.remove_many([uid2])
+    lookup_table.max_age = 3600
+    uid3 = other.append({'a': 3})
+    with pytest.raises(RuntimeError, match='no longer be unique'):
+        lookup_table.drop_columns('a')
+    lookup_table.max_age = 0
+    other.remove_many([uid1])
+    lookup_table.drop_columns('a')
+    assert other.table == [['id'], [uid3]]
+    assert lookup_table.table == [['id'], [uid3]]
+
+
+def test_search(lookup_table):
+    other_group_id = f'{GROUP_ID}.other'
+    missing_group_id = f'{GROUP_ID}.missing'
+    p = {'a': 1, 'b': 'x'}
+    lookup_table.extend(['a', 'b'])
+    uid1 = lookup_table.append(p)
+    for version in ['1.0.0', '2.0.0', '3.0.0']:
+        audfactory.Lookup.create(
+            SERVER,
+            REPOSITORY,
+            other_group_id,
+            version,
+            ['a', 'b'],
+            format='log' if version == '2.0.0' else 'csv',
+        )
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        other_group_id,
+        version='2.0.0',
+    )
+    uid2 = lookup.append(p)
+    lookup.append({'a': 2, 'b': 'x'})
+    lookup = audfactory.Lookup(
+        SERVER,
+        REPOSITORY,
+        other_group_id,
+        version='3.0.0',
+    )
+    uid3 = lookup.append(p)
+    # Version without lookup table
+    url = audfactory.url(
+        SERVER,
+        repository=REPOSITORY,
+        group_id=other_group_id,
+        name='lookup',
+        version='4.0.0',
+    )
+    audfactory.path(url).mkdir()
+
+    def search(group_ids, params):
+        return audfactory.Lookup.search(
+            SERVER,
+            REPOSITORY,
+            group_ids,
+            params,
+            num_workers=3,
+        )
+
+    expected = [
+        (other_group_id, '2.0.0', uid2),
+        (other_group_id, '3.0.0', uid3),
+        (GROUP_ID, VERSION, uid1),
+    ]
+    group_ids = [other_group_id, missing_group_id, GROUP_ID, other_group_id]
+    assert search(group_ids, p) == expected
+    assert search(GROUP_ID, p) == expected[-1:]
+    assert search(group_ids, {'a': 3, 'b': 'x'}) == []
+    assert search([], p) == []
+    # Use index
+    audfactory.Lookup.create_index(SERVER, REPOSITORY, other_group_id)
+    assert search(group_ids, p) == expected
+    assert search(group_ids, {'a': 2, 'b': 'x'})[0][:2] == (
+        other_group_id,
+        '2.0.0',
+    )
+
+
+def test_copy_diff_merge(lookup_table):
+    lookup_table.extend(['a', 'b'])
+    uids = lookup_table.append_many([{'a': n, 'b': 'x'} for n in range(4)])
+
+    # Copy to new version
+    lookup = lookup_table.copy_to('2.0.0', format='log')
+    assert lookup.version == '2.0.0'
+    assert lookup.format == 'log'
+    assert lookup.table == lookup_table.table
+    other = audfactory.Lookup(SERVER, REPOSITORY, GROUP_ID, version='2.0.0')
+    assert other.format == 'log'
+    assert other.table == lookup_table.table
+    with pytest.raises(RuntimeError, match='exists already'):
+        lookup_table.copy_to('2.0.0')
+    other = lookup_table.copy_to('2.0.0', force=True)
+    assert other.format == 'csv'
+    assert audfactory.Lookup.versions(SERVER, REPOSITORY, GROUP_ID) == [
+        VERSION,
+        '2.0.0',
+    ]
+
+    # Diff
+    assert other.diff(lookup_table) == {
+        'added': [],
+        'removed': [],
+        'changed': [],
+    }
+    other.remove_many(uids[:2])
+    uid = other.append({'a': 10, 'b': 'x'})
+    assert other.diff(lookup_table) == {
+        'added': uids[:2],
+        'removed': [uid],
+        'changed': [],
+    }
+    assert lookup_table.diff(other) == {
+        'added': [uid],
+        'removed': uids[:2],
+        'changed': [],
+    }
+    lookup_table.extend('c')
+    assert lookup_table.diff(other)['changed'] == uids[2:]
+
+    # Merge
+    with pytest.raises(RuntimeError, match='do not match'):
+        lookup_table.merge(other)
+    other.extend('c')
+    assert lookup_table.merge(other) == [uid]
+    assert lookup_table.merge(other) == []
+    assert other.merge(lookup_table) == uids[:2]
+    assert other.diff(lookup_table) == {
+        'added': [],
+        'removed': [],
+        'changed': [],
+    }
+    assert sorted(other.ids) == sorted(lookup_table.ids)
+    other.remove_many(uids)
+    other.append({'a': 0, 'b': 'x', 'c': None})
+    with pytest.raises(RuntimeError, match='already exists'):
+        other.merge(lookup_table)
+
+    other.clear()
+    audfactory.Lookup.delete(SERVER, REPOSITORY, GROUP_ID, '2.0.0')